@@ -1,25 +1,48 @@
 """Script execution for container lifecycle management - CLI version"""
 from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
 import subprocess
 import os
 import logging
+import queue
+import atexit
 
 # Logger
 logger = logging.getLogger("scripts")
 # Don't set level here - let it inherit from root logger
 
 # Configura il file handler per scrivere su venv/cli.log
+# (records go through a queue, a background listener thread does the writes)
 LOG_FILE = Path(__file__).parent.parent.parent.parent / "venv" / "cli.log"
 if not logger.handlers:
     file_handler = logging.FileHandler(str(LOG_FILE), mode='a', encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     formatter = logging.Formatter('[%(asctime)s] [%(levelname)s] [SCRIPTS] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
 
 BASE_DIR = Path(__file__).parent.parent.parent.parent
 SCRIPTS_DIR = BASE_DIR / "scripts"
 SHARED_DIR = BASE_DIR / "shared-volumes"
+SCRIPTS_DIR_STR = str(SCRIPTS_DIR)
+SHARED_DIR_STR = str(SHARED_DIR)
+
+# Environment shared by every script run, copied from os.environ once
+_BASE_SCRIPT_ENV = {**os.environ, 'SHARED_DIR': SHARED_DIR_STR}
+
+# Default script lookup paths (in order of preference), as str templates:
+# 1. Stack-specific scripts: stacks/{container_name}/init.sh or halt.sh
+# 2. Simple init/halt scripts: init/{container_name}.sh or halt/{container_name}.sh
+_DEFAULT_SCRIPT_TEMPLATES = (
+    SCRIPTS_DIR_STR + "/stacks/{c}/{t}.sh",
+    SCRIPTS_DIR_STR + "/{t}/{c}.sh",
+)
+_SCRIPTS_PREFIX_LEN = len(SCRIPTS_DIR_STR) + 1
 
 
 def execute_script(script_config, full_container_name: str, container_name: str, script_type: str = "init") -> None:
@@ -37,22 +60,15 @@ def execute_script(script_config, full_container_name: str, container_name: str,
         container_name: Container name without prefix (e.g., 'mysql-8.0')
         script_type: Type of script - 'init' (post-start) or 'halt' (pre-stop)
     """
-    # Default script lookup paths (in order of preference)
-    default_script_paths = [
-        # 1. Stack-specific scripts: stacks/{container_name}/init.sh or halt.sh
-        SCRIPTS_DIR / "stacks" / container_name / f"{script_type}.sh",
-        # 2. Simple init/halt scripts: init/{container_name}.sh or halt/{container_name}.sh
-        SCRIPTS_DIR / script_type / f"{container_name}.sh",
-    ]
-
     # Find the first existing default script
     default_script_path = None
     default_script_name = None
 
-    for script_path in default_script_paths:
-        if script_path.exists():
+    for template in _DEFAULT_SCRIPT_TEMPLATES:
+        script_path = template.format(c=container_name, t=script_type)
+        if os.path.exists(script_path):
             default_script_path = script_path
-            default_script_name = str(script_path.relative_to(SCRIPTS_DIR))
+            default_script_name = script_path[_SCRIPTS_PREFIX_LEN:]
             logger.info("Found default %s script: %s", script_type, default_script_name)
             break
 
@@ -89,22 +105,16 @@ def execute_script(script_config, full_container_name: str, container_name: str,
                 if isinstance(script_to_execute, dict) and 'inline' in script_to_execute:
                     script_content = script_to_execute['inline']
                     
-                    temp_script = f"/tmp/playground-script-{full_container_name}-{script_label}.sh"
-                    with open(temp_script, 'w') as f:
-                        f.write("#!/bin/bash\n")
-                        f.write(f'CONTAINER_NAME="{full_container_name}"\n')
-                        f.write(f'SHARED_DIR="{SHARED_DIR}"\n')
-                        f.write(script_content)
-                    
-                    os.chmod(temp_script, 0o755)
-                    
                     logger.info("Executing %s inline %s script", script_label, script_type)
                     
+                    # Run the body in memory with `bash -c` ($0 = name, $1 = container)
                     result = subprocess.run(
-                        ['bash', temp_script, full_container_name],
+                        ['bash', '-c', script_content,
+                         f"{full_container_name}-{script_label}-inline.sh", full_container_name],
                         capture_output=True,
                         text=True,
-                        timeout=300
+                        timeout=300,
+                        env={**_BASE_SCRIPT_ENV, 'CONTAINER_NAME': full_container_name}
                     )
                     
                     if result.returncode == 0:
@@ -115,21 +125,19 @@ def execute_script(script_config, full_container_name: str, container_name: str,
                         logger.error("✗ %s inline script failed with exit code: %d", script_label, result.returncode)
                         if result.stderr:
                             logger.error("Error: %s", result.stderr.strip())
-                    
-                    os.remove(temp_script)
                 
                 # File-based script
                 elif isinstance(script_to_execute, str):
-                    script_path = SCRIPTS_DIR / script_to_execute
-                    if script_path.exists():
+                    script_path = os.path.join(SCRIPTS_DIR_STR, script_to_execute)
+                    if os.path.exists(script_path):
                         logger.info("Executing %s file %s script: %s", script_label, script_type, script_to_execute)
                         
                         result = subprocess.run(
-                            ['bash', str(script_path), full_container_name],
+                            ['bash', script_path, full_container_name],
                             capture_output=True,
                             text=True,
                             timeout=300,
-                            env={**os.environ, 'SHARED_DIR': str(SHARED_DIR)}
+                            env=_BASE_SCRIPT_ENV
                         )
                         
                         if result.returncode == 0:
@@ -3,6 +3,7 @@ Script execution utilities for CLI
 Handles post-start and pre-stop scripts with inline and file-based support
 """
 
+import os
 import subprocess
 from pathlib import Path
 from rich.console import Console
@@ -39,25 +40,23 @@ def execute_script(script_config, container_name: str, image_name: str):
 
 def execute_inline_script(script_content: str, container_name: str, image_name: str):
     """Execute inline script from config"""
-    temp_script = f"/tmp/playground-script-{container_name}.sh"
+    # Values are passed through the environment rather than written into
+    # the script body, so they need no quoting and can't inject commands
+    env = {
+        **os.environ,
+        'CONTAINER_NAME': container_name,
+        'IMAGE_NAME': image_name,
+        'SHARED_DIR': str(SHARED_DIR),
+    }
     
     try:
-        # Create temporary script file
-        with open(temp_script, 'w') as f:
-            f.write("#!/bin/bash\n")
-            f.write(f'CONTAINER_NAME="{container_name}"\n')
-            f.write(f'IMAGE_NAME="{image_name}"\n')
-            f.write(f'SHARED_DIR="{SHARED_DIR}"\n')
-            f.write(script_content)
-        
-        Path(temp_script).chmod(0o755)
-        
-        # Execute inline script
+        # Execute inline script ($0 is a display name, $1 the container name)
         result = subprocess.run(
-            ['bash', temp_script, container_name],
+            ['bash', '-c', script_content, f"playground-script-{container_name}.sh", container_name],
             capture_output=True,
             text=True,
-            timeout=60
+            timeout=60,
+            env=env
         )
         
         if result.returncode == 0:
@@ -69,15 +68,10 @@ def execute_inline_script(script_content: str, container_name: str, image_name:
             if result.stderr:
                 console.print(f"[dim]{result.stderr}[/dim]")
         
-        # Cleanup
-        Path(temp_script).unlink(missing_ok=True)
-        
     except subprocess.TimeoutExpired:
         console.print(f"[red]❌ Inline script timeout for {container_name}[/red]")
-        Path(temp_script).unlink(missing_ok=True)
     except Exception as e:
         console.print(f"[red]❌ Inline script execution failed: {e}[/red]")
-        Path(temp_script).unlink(missing_ok=True)
 
 
 def execute_file_script(script_path: str, container_name: str, image_name: str):
@@ -11,7 +11,7 @@ from pathlib import Path
 from src.web.core.config import load_config
 from src.web.core.docker import docker_client, get_stop_timeout
 from src.web.core.scripts import execute_script
-from src.web.core.state import create_operation, update_operation, complete_operation, fail_operation, active_operations
+from src.web.core.state import create_operation, update_operation, complete_operation, fail_operation, active_operations, serialize_operation
 from src.web.utils import to_full_name, to_display_name
 
 logger = get_logger(__name__)
@@ -439,7 +439,7 @@ async def cleanup_status(container_name: str, operation_id: str):
         if not operation:
             raise HTTPException(404, f"Operation not found")
         
-        return operation
+        return serialize_operation(operation)
     except HTTPException:
         raise
     except Exception as e:
@@ -199,6 +199,8 @@ async def start_group_background(operation_id: str, group_name: str, containers:
     try:
         loop = asyncio.get_event_loop()
         
+        # Sequential on purpose: stack members rely on declaration order
+        # (e.g. the database's post_start must finish before the web app starts)
         for container_name in containers:
             try:
                 img_data = images[container_name]
@@ -382,10 +384,10 @@ async def get_group_status(group_name: str):
 @router.get("/api/operation-status/{operation_id}")
 async def get_operation_status(operation_id: str):
     """Get status of async operation"""
-    from src.web.core.state import get_operation
+    from src.web.core.state import get_operation, serialize_operation
     
     operation = get_operation(operation_id)
     if not operation:
         raise HTTPException(404, "Operation not found")
     
-    return operation
\ No newline at end of file
+    return serialize_operation(operation)
\ No newline at end of file
@@ -13,7 +13,7 @@ from typing import List, Dict, Any
 from src.web.api.cleanup import cleanup_old_backups
 from src.web.core.config import load_config
 from src.web.core.docker import (
-    docker_client, ensure_network, SHARED_DIR, NETWORK_NAME,
+    docker_client, ensure_network, invalidate_network, SHARED_DIR, NETWORK_NAME,
     get_stop_timeout, prepare_volumes, ensure_named_volumes,
     start_single_container_sync, stop_single_container_sync
 )
@@ -367,6 +367,10 @@ async def start_category(category: str):
                     started.append(img_name)
                     logger.info(f"Container {container_name} started (category: {category})")
                 
+                except docker.errors.APIError as e:
+                    # The network may have been removed behind our back: re-check it next time
+                    invalidate_network()
+                    logger.error(f"Failed to start {img_name}: {e}")
                 except Exception as e:
                     logger.error(f"Failed to start {img_name}: {e}")
     
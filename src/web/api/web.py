@@ -10,7 +10,7 @@ from src.web.core.config import load_config
 from src.web.core.docker import docker_client, get_container_features
 from src.web.utils.helpers import natural_sort_key
 from src.web.utils.motd_processor import parse_motd_commands, clean_motd_text, motd_to_html
-from src.web.utils import to_full_name, to_display_name
+from src.web.utils import to_full_name, to_display_name, has_prefix
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -69,7 +69,7 @@ async def dashboard(request: Request):
         features_dict = {}
         
         for c in running:
-            if c.name.startswith("playground-"):
+            if has_prefix(c.name):
                 image_name = to_display_name(c.name)
                 running_dict[image_name] = {"name": c.name, "status": c.status}
         
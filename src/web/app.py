@@ -394,7 +394,7 @@ async def startup_event():
     # Initialize asset versioning manager
     try:
         asset_manager = init_asset_manager(str(STATIC_DIR))
-        logger.info("✓ Asset versioning initialized")
+        logger.info("✓ Asset versioning initialized (%d assets hashed)", asset_manager.asset_count)
     except Exception as e:
         logger.warning("! Failed to initialize asset manager: %s", str(e))
     
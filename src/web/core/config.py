@@ -13,6 +13,7 @@ from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent
 
 from .logging_config import get_logger
+from .scripts import invalidate_default_scripts_cache
 
 logger = get_logger(__name__)
 
@@ -420,8 +421,10 @@ def load_config(include_group_containers: bool = False) -> Dict[str, Dict[str, A
     if cached is not None:
         return cached
 
-    # Cache miss, load and cache
+    # Cache miss, load and cache. Config changes often come with new or
+    # removed init/halt scripts, so rescan those too
     _config_cache.stats["misses"] += 1
+    invalidate_default_scripts_cache()
     config = _load_config_internal(include_group_containers)
     _config_cache.set(config)
 
@@ -438,6 +441,7 @@ def invalidate_config_cache():
     Call this after adding/modifying config files
     """
     _config_cache.invalidate()
+    invalidate_default_scripts_cache()
     logger.info("Configuration cache invalidated")
 
 
@@ -1,24 +1,34 @@
 """Docker client management and container utilities"""
 import os
-from typing import Dict, Any
 import docker
 import socket
 import logging
 from typing import Dict, Any, List, Tuple
 from pathlib import Path
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .docker_compose_params import extract_docker_params
 from .logging_config import get_module_logger
+from .scripts import execute_script, find_default_script
+from .state import add_script_tracking, complete_script_tracking, update_operation
 from src.web.utils import to_full_name, to_display_name
 
 # Use centralized logger
 logger = get_module_logger("docker")
 
-docker_client = docker.from_env()
+# High-level client for .run()/.stop() and friends; the larger connection
+# pool keeps HTTP keep-alive effective when containers start in parallel
+docker_client = docker.from_env(max_pool_size=25)
+
+# Low-level client (shares the connection pool) for inspect/list/event calls
+# that only need raw JSON and would otherwise build SDK objects
+low_client = docker_client.api
 
 # Paths and configurations
 BASE_DIR = Path(__file__).parent.parent.parent.parent
+BASE_DIR_STR = str(BASE_DIR)
 SHARED_DIR = BASE_DIR / "shared-volumes"
 NETWORK_NAME = "playground-network"
 SCRIPTS_DIR = BASE_DIR / "scripts"
@@ -36,7 +46,7 @@ class TimeoutConfig:
     
     # Container startup
     CONTAINER_START_TIMEOUT = int(os.getenv('PLAYGROUND_START_TIMEOUT', '60'))  # Default 60s, up from 30s
-    CONTAINER_START_POLL_INTERVAL = 0.5  # seconds
+    CONTAINER_START_POLL_INTERVAL = 0.5  # seconds (fallback when the event stream is unavailable)
     
     # Container stop
     CONTAINER_STOP_TIMEOUT_DEFAULT = int(os.getenv('PLAYGROUND_STOP_TIMEOUT', '10'))  # Default 10s
@@ -48,8 +58,9 @@ class TimeoutConfig:
     # Docker API calls
     DOCKER_API_TIMEOUT = int(os.getenv('PLAYGROUND_API_TIMEOUT', '30'))
     
-    # Port check
-    PORT_CHECK_TIMEOUT = int(os.getenv('PLAYGROUND_PORT_CHECK_TIMEOUT', '1'))
+    # Port check (localhost probes answer in well under 50ms)
+    PORT_CHECK_TIMEOUT = float(os.getenv('PLAYGROUND_PORT_CHECK_TIMEOUT', '0.05'))
+    PORT_CHECK_MAX_WORKERS = 16
     
     @classmethod
     def log_config(cls):
@@ -61,37 +72,62 @@ class TimeoutConfig:
         logger.info("  Container Stop (with scripts): %ds", cls.CONTAINER_STOP_TIMEOUT_WITH_SCRIPTS)
         logger.info("  Script Execution: %ds", cls.SCRIPT_EXECUTION_TIMEOUT)
         logger.info("  Docker API: %ds", cls.DOCKER_API_TIMEOUT)
-        logger.info("  Port Check: %ds", cls.PORT_CHECK_TIMEOUT)
+        logger.info("  Port Check: %.2fs", cls.PORT_CHECK_TIMEOUT)
 
 
 # Log configuration on module load
 TimeoutConfig.log_config()
 
+# Set once the network is known to exist, reset when a container launch fails
+_network_ready: bool = False
+_network_lock = threading.Lock()
+
+
 def ensure_network():
-    """Ensure playground network exists"""
-    try:
-        docker_client.networks.get(NETWORK_NAME)
-        logger.info("Network %s already exists", NETWORK_NAME)
-    except docker.errors.NotFound:
-        logger.info("Creating network %s", NETWORK_NAME)
-        docker_client.networks.create(NETWORK_NAME, driver="bridge")
-        logger.info("Network %s created", NETWORK_NAME)
+    """Ensure playground network exists (checked once per process)"""
+    global _network_ready
+    if _network_ready:
+        return
+
+    # Parallel starts must not race networks.create
+    with _network_lock:
+        if _network_ready:
+            return
+        try:
+            docker_client.networks.get(NETWORK_NAME)
+            logger.info("Network %s already exists", NETWORK_NAME)
+        except docker.errors.NotFound:
+            logger.info("Creating network %s", NETWORK_NAME)
+            docker_client.networks.create(NETWORK_NAME, driver="bridge")
+            logger.info("Network %s created", NETWORK_NAME)
+        _network_ready = True
+
+
+def invalidate_network():
+    """Force the next ensure_network() call to query Docker again"""
+    global _network_ready
+    with _network_lock:
+        _network_ready = False
 
 
 def ensure_named_volumes(volumes_config: List[Dict[str, Any]]):
     """Create named volumes if they don't exist"""
     if not volumes_config:
         return
-    
-    for vol_data in volumes_config:
-        if vol_data.get("type") == "named":
-            vol_name = vol_data.get("name")
-            if vol_name:
-                try:
-                    docker_client.volumes.get(vol_name)
-                except docker.errors.NotFound:
-                    logger.info("Creating named volume: %s", vol_name)
-                    docker_client.volumes.create(name=vol_name, driver="local")
+
+    wanted = {
+        vol_data["name"] for vol_data in volumes_config
+        if vol_data.get("type") == "named" and vol_data.get("name")
+    }
+    if not wanted:
+        return
+
+    # One list call instead of one get per volume
+    existing = {vol.name for vol in docker_client.volumes.list()}
+
+    for vol_name in sorted(wanted - existing):
+        logger.info("Creating named volume: %s", vol_name)
+        docker_client.volumes.create(name=vol_name, driver="local")
 
 
 def convert_to_host_path(container_path: str) -> str:
@@ -118,6 +154,10 @@ def convert_to_host_path(container_path: str) -> str:
     return container_path
 
 
+# Host paths already created by prepare_volumes() in this process
+_prepared_paths: set = set()
+
+
 def prepare_volumes(volumes_config: List[Dict[str, Any]]) -> List[str]:
     """Prepare volumes for docker-compose format"""
     if not volumes_config:
@@ -146,19 +186,24 @@ def prepare_volumes(volumes_config: List[Dict[str, Any]]) -> List[str]:
             host_path = vol_data.get("host")
             if host_path:
                 if not host_path.startswith("/"):
-                    host_path = str(BASE_DIR / host_path)
+                    host_path = os.path.normpath(os.path.join(BASE_DIR_STR, host_path))
 
                 # Convert to host path if running in Docker
                 host_path = convert_to_host_path(host_path)
 
-                try:
-                    if vol_type == "bind":
-                        Path(host_path).mkdir(parents=True, exist_ok=True)
-                    elif vol_type == "file":
-                        Path(host_path).parent.mkdir(parents=True, exist_ok=True)
-                        Path(host_path).touch(exist_ok=True)
-                except Exception as e:
-                    logger.warning("Failed to prepare volume path %s: %s", host_path, str(e))
+                # Skip the mkdir/touch work for paths prepared on a previous start
+                # (a single stat still catches paths removed in the meantime)
+                prepared_key = f"{vol_type}:{host_path}"
+                if prepared_key not in _prepared_paths or not os.path.exists(host_path):
+                    try:
+                        if vol_type == "bind":
+                            Path(host_path).mkdir(parents=True, exist_ok=True)
+                        elif vol_type == "file":
+                            Path(host_path).parent.mkdir(parents=True, exist_ok=True)
+                            Path(host_path).touch(exist_ok=True)
+                        _prepared_paths.add(prepared_key)
+                    except Exception as e:
+                        logger.warning("Failed to prepare volume path %s: %s", host_path, str(e))
 
                 vol_str = f"{host_path}:{vol_path}"
                 if readonly:
@@ -168,25 +213,45 @@ def prepare_volumes(volumes_config: List[Dict[str, Any]]) -> List[str]:
     return compose_volumes
 
 
-def check_port_available(port: int) -> Tuple[bool, str]:
+def get_used_host_ports() -> Dict[str, str]:
+    """Map host ports published by existing containers to the container using them
+
+    Uses a single raw list call: the high-level containers.list() would
+    inspect every container individually.
+
+    Returns:
+        Dict[str, str]: host port (as string) -> container name
+    """
+    used_ports = {}
+    for container in low_client.containers(all=True):
+        ports = container.get('Ports')
+        if not ports:
+            continue
+        names = container.get('Names') or []
+        name = names[0].lstrip('/') if names else container.get('Id', '')[:12]
+        for binding in ports:
+            public_port = binding.get('PublicPort')
+            if public_port:
+                used_ports.setdefault(str(public_port), name)
+    return used_ports
+
+
+def check_port_available(port: int, used_ports: Dict[str, str] = None) -> Tuple[bool, str]:
     """Check if a port is available on the host
     
     Args:
         port: Port number to check
+        used_ports: Optional pre-built map from get_used_host_ports()
     
     Returns:
         Tuple[bool, str]: (is_available, used_by_container_or_system)
     """
     try:
-        all_containers = docker_client.containers.list(all=True)
-        for container in all_containers:
-            ports = container.attrs.get('NetworkSettings', {}).get('Ports', {})
-            if ports:
-                for container_port, bindings in ports.items():
-                    if bindings:
-                        for binding in bindings:
-                            if binding and binding.get('HostPort') == str(port):
-                                return False, container.name
+        if used_ports is None:
+            used_ports = get_used_host_ports()
+        used_by = used_ports.get(str(port))
+        if used_by:
+            return False, used_by
         
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(TimeoutConfig.PORT_CHECK_TIMEOUT)
@@ -201,44 +266,122 @@ def check_port_available(port: int) -> Tuple[bool, str]:
         logger.warning("Error checking port %d: %s", port, str(e))
         return True, ""
 
-def validate_ports_available(img_data: Dict[str, Any], container_name: str) -> Tuple[bool, List[Dict[str, Any]]]:
-    """Validate all ports are available for a container"""
-    conflicts = []
-    ports = img_data.get("ports", [])
+def parse_port_mappings(port_list: List[Any]) -> Tuple[List[Tuple[str, str]], List[Dict[str, Any]]]:
+    """Split 'host:container' port mappings in a single pass
 
-    for i, port_mapping in enumerate(ports):
-        # Validate that port_mapping is a string
+    Args:
+        port_list: Raw "ports" list from the image configuration
+
+    Returns:
+        Tuple: (parsed, invalid) - parsed is a list of (host_port, container_port)
+        strings, invalid lists {"index", "value", "error"} for entries that are
+        not strings or have no ':'
+    """
+    parsed = []
+    invalid = []
+
+    for i, port_mapping in enumerate(port_list):
         if not isinstance(port_mapping, str):
-            error_msg = f"Port mapping at index {i} must be a string, got {type(port_mapping).__name__}: {repr(port_mapping)}"
-            logger.error("%s: %s", container_name, error_msg)
-            logger.error("%s: This usually means the port wasn't quoted in YAML config", container_name)
-            logger.error("%s: YAML may have parsed it as a number (e.g., 2222:22 as sexagesimal)", container_name)
-
-            # Return a conflict with helpful error information
-            conflicts.append({
-                "host_port": "invalid",
-                "container_port": "invalid",
-                "used_by": f"Configuration Error: {error_msg}. Tip: Quote port mappings in YAML (e.g., \"3000:3000\")"
+            invalid.append({
+                "index": i,
+                "value": port_mapping,
+                "error": f"Port mapping at index {i} must be a string, got {type(port_mapping).__name__}: {repr(port_mapping)}"
+            })
+            continue
+
+        host_port, sep, container_port = port_mapping.partition(":")
+        if not sep:
+            invalid.append({
+                "index": i,
+                "value": port_mapping,
+                "error": f"Port mapping must be in format 'host:container', got: {port_mapping}"
             })
             continue
 
+        parsed.append((host_port, container_port))
+
+    return parsed, invalid
+
+
+def validate_ports_available(
+    img_data: Dict[str, Any],
+    container_name: str,
+    parsed_ports: List[Tuple[str, str]] = None,
+    invalid_ports: List[Dict[str, Any]] = None
+) -> Tuple[bool, List[Dict[str, Any]]]:
+    """Validate all ports are available for a container
+
+    Port probes run concurrently, so the total wait is bounded by the
+    slowest probe instead of the sum of all of them.
+
+    Args:
+        img_data: Image configuration dict
+        container_name: Container name (for logging)
+        parsed_ports/invalid_ports: Optional output of parse_port_mappings(),
+            to avoid parsing twice
+    """
+    if parsed_ports is None:
+        parsed_ports, invalid_ports = parse_port_mappings(img_data.get("ports") or [])
+    if not parsed_ports and not invalid_ports:
+        return True, []
+
+    conflicts = []
+
+    for invalid in invalid_ports or []:
+        port_mapping = invalid["value"]
+        if isinstance(port_mapping, str):
+            logger.warning("%s: Invalid port mapping format: %s", container_name, port_mapping)
+            continue
+
+        error_msg = invalid["error"]
+        logger.error("%s: %s", container_name, error_msg)
+        logger.error("%s: This usually means the port wasn't quoted in YAML config", container_name)
+        logger.error("%s: YAML may have parsed it as a number (e.g., 2222:22 as sexagesimal)", container_name)
+
+        # Return a conflict with helpful error information
+        conflicts.append({
+            "host_port": "invalid",
+            "container_port": "invalid",
+            "used_by": f"Configuration Error: {error_msg}. Tip: Quote port mappings in YAML (e.g., \"3000:3000\")"
+        })
+
+    # Non-numeric host ports can't be probed; Docker reports them at launch
+    to_check = []
+    for host_port, container_port in parsed_ports:
         try:
-            if ':' not in port_mapping:
-                logger.warning("%s: Invalid port mapping format: %s", container_name, port_mapping)
-                continue
+            to_check.append((int(host_port), container_port))
+        except ValueError as e:
+            logger.warning("%s: Invalid port mapping: %s:%s - %s", container_name,
+                           host_port, container_port, str(e))
 
-            host_port, container_port = port_mapping.split(":", 1)
-            host_port_int = int(host_port)
+    if not to_check:
+        return len(conflicts) == 0, conflicts
 
-            is_available, used_by = check_port_available(host_port_int)
+    try:
+        used_ports = get_used_host_ports()
+    except Exception as e:
+        logger.warning("%s: Error listing container ports: %s", container_name, str(e))
+        used_ports = {}
+
+    port_conflicts = {}
+    max_workers = min(TimeoutConfig.PORT_CHECK_MAX_WORKERS, len(to_check))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(check_port_available, host_port, used_ports): (idx, host_port, container_port)
+            for idx, (host_port, container_port) in enumerate(to_check)
+        }
+        for future in as_completed(futures):
+            idx, host_port, container_port = futures[future]
+            is_available, used_by = future.result()
             if not is_available:
-                conflicts.append({
-                    "host_port": host_port_int,
+                port_conflicts[idx] = {
+                    "host_port": host_port,
                     "container_port": container_port,
                     "used_by": used_by
-                })
-        except ValueError as e:
-            logger.warning("%s: Invalid port mapping: %s - %s", container_name, port_mapping, str(e))
+                }
+
+    # Keep conflicts in declaration order
+    conflicts.extend(port_conflicts[idx] for idx in sorted(port_conflicts))
 
     return len(conflicts) == 0, conflicts
 
@@ -252,7 +395,7 @@ def get_stop_timeout(img_data: Dict[str, Any]) -> int:
     Returns:
         int: Stop timeout in seconds
     """
-    scripts = img_data.get("scripts", {})
+    scripts = img_data.get("scripts") or {}
     
     if scripts.get("pre_stop"):
         timeout = TimeoutConfig.CONTAINER_STOP_TIMEOUT_WITH_SCRIPTS
@@ -262,6 +405,90 @@ def get_stop_timeout(img_data: Dict[str, Any]) -> int:
     return TimeoutConfig.CONTAINER_STOP_TIMEOUT_DEFAULT
 
 
+def _reload_status(container) -> str:
+    """Refresh and return the container status ("unknown" on transient errors)"""
+    try:
+        container.reload()
+        return container.status
+    except docker.errors.NotFound:
+        raise
+    except Exception as e:
+        logger.warning("Error checking container status: %s", str(e))
+        return "unknown"
+
+
+def _poll_container_status(container, max_wait: float, start_time: float) -> str:
+    """Poll the container state until it is running, has exited, or max_wait expires"""
+    wait_interval = TimeoutConfig.CONTAINER_START_POLL_INTERVAL
+    logger.debug("Polling container status (max %ds, interval %.2fs)", max_wait, wait_interval)
+
+    while time.time() - start_time < max_wait:
+        status = _reload_status(container)
+        if status in ("running", "exited", "dead"):
+            return status
+        time.sleep(wait_interval)
+
+    return _reload_status(container)
+
+
+def wait_for_container_status(container, max_wait: float, launched_at: float) -> str:
+    """Wait until a freshly created container is running or has exited
+
+    Blocks on the Docker event stream for the container instead of polling
+    its state; falls back to polling when the event stream is unavailable.
+
+    Args:
+        container: Container object returned by containers.run
+        max_wait: Maximum time to wait from now, in seconds
+        launched_at: time.time() taken before containers.run was called
+
+    Returns:
+        str: Last known container status ("running", "exited", "dead", ...)
+
+    Raises:
+        docker.errors.NotFound: If the container disappeared
+    """
+    deadline = time.time() + max_wait
+    try:
+        # "since" replays events emitted before we subscribed (e.g. the start
+        # event of containers.run), "until" makes the daemon end the stream
+        events = low_client.events(
+            since=int(launched_at) - 1,
+            until=int(deadline) + 1,
+            filters={"container": container.id, "event": ["start", "die", "oom"]},
+            decode=True
+        )
+    except Exception as e:
+        logger.warning("Docker event stream unavailable (%s), polling container status", str(e))
+        return _poll_container_status(container, max_wait, time.time())
+
+    # Watchdog in case the daemon does not honour "until"
+    watchdog = threading.Timer(max(0.0, deadline - time.time()), events.close)
+    watchdog.daemon = True
+    watchdog.start()
+
+    try:
+        # The state may already be final (or its events outside the replay
+        # window, e.g. with daemon clock skew): check once after subscribing
+        status = _reload_status(container)
+        if status in ("running", "exited", "dead"):
+            return status
+
+        for event in events:
+            action = event.get("Action") or event.get("status")
+            if action in ("start", "die", "oom"):
+                # A container can exit right after starting: report its
+                # current state rather than trusting the start event
+                break
+    except docker.errors.NotFound:
+        raise
+    except Exception as e:
+        logger.debug("Docker event stream closed: %s", str(e))
+    finally:
+        watchdog.cancel()
+        events.close()
+
+    return _reload_status(container)
 
 
 def start_single_container_sync(container_name: str, img_data: Dict[str, Any], operation_id: str = None) -> Dict[str, Any]:
@@ -280,9 +507,6 @@ def start_single_container_sync(container_name: str, img_data: Dict[str, Any], o
         - "already_running": Container was already running
         - "failed": Container failed to start
     """
-    from src.web.core.scripts import execute_script
-    from src.web.core.state import add_script_tracking, complete_script_tracking, update_operation
-
     full_container_name = to_full_name(container_name)
     logger.info("Starting container: %s (timeout: %ds)", container_name, TimeoutConfig.CONTAINER_START_TIMEOUT)
 
@@ -306,15 +530,17 @@ def start_single_container_sync(container_name: str, img_data: Dict[str, Any], o
     except docker.errors.NotFound:
         pass
 
-    # Validate ports
-    ports_available, conflicts = validate_ports_available(img_data, container_name)
+    # Parse ports once, then check they are free
+    port_list = img_data.get("ports") or []
+    parsed_ports, invalid_ports = parse_port_mappings(port_list)
+    ports_available, conflicts = validate_ports_available(img_data, container_name,
+                                                          parsed_ports, invalid_ports)
     if not ports_available:
         conflict_list = [f"{c['host_port']} (used by {c['used_by']})" for c in conflicts]
         error_msg = f"Port conflicts: {', '.join(conflict_list)}"
         logger.error("%s: %s", container_name, error_msg)
 
         # Check if this is a configuration error (invalid port type)
-        port_list = img_data.get("ports", [])
         has_config_error = any(c['host_port'] == 'invalid' for c in conflicts)
 
         if has_config_error:
@@ -343,6 +569,16 @@ def start_single_container_sync(container_name: str, img_data: Dict[str, Any], o
 
         return {"status": "failed", "name": container_name, "error": error_msg}
 
+    # Only malformed strings are left here (non-strings are port conflicts above)
+    if invalid_ports:
+        error_msg = invalid_ports[0]["error"]
+        logger.error("%s: %s", container_name, error_msg)
+        return {
+            "status": "failed",
+            "name": container_name,
+            "error": error_msg
+        }
+
     # Prepare volumes
     update_phase("preparing_volumes")
     volumes_config = img_data.get("volumes", [])
@@ -355,57 +591,13 @@ def start_single_container_sync(container_name: str, img_data: Dict[str, Any], o
     all_volumes = [f"{shared_host_path}:/shared"]
     all_volumes.extend(compose_volumes)
 
-    # Parse and validate ports
-    ports = {}
-    port_list = img_data.get("ports", [])
-    for i, p in enumerate(port_list):
-        if not isinstance(p, str):
-            error_msg = f"Port mapping must be a string, got {type(p).__name__}: {repr(p)}"
-            logger.error("%s: Invalid port configuration at index %d: %s", container_name, i, error_msg)
-
-            # Add helpful debug information
-            debug_info = {
-                "error_type": "InvalidPortConfiguration",
-                "port_index": i,
-                "port_value": repr(p),
-                "port_type": type(p).__name__,
-                "all_ports": [{"index": idx, "value": repr(port), "type": type(port).__name__}
-                             for idx, port in enumerate(port_list)],
-                "tips": [
-                    "Port mappings must be quoted strings in YAML (e.g., \"3000:3000\")",
-                    f"YAML parsed port at index {i} as {type(p).__name__} instead of string",
-                    "Common issue: YAML interprets unquoted values like 2222:22 as sexagesimal numbers",
-                    "Fix: Add quotes around all port mappings in your YAML config",
-                ],
-                "fix_example": {
-                    "wrong": "ports:\n  - 3000:3000\n  - 2222:22",
-                    "correct": "ports:\n  - \"3000:3000\"\n  - \"2222:22\""
-                }
-            }
-
-            return {
-                "status": "failed",
-                "name": container_name,
-                "error": error_msg,
-                "debug_info": debug_info
-            }
-
-        if ':' not in p:
-            error_msg = f"Port mapping must be in format 'host:container', got: {p}"
-            logger.error("%s: %s", container_name, error_msg)
-            return {
-                "status": "failed",
-                "name": container_name,
-                "error": error_msg
-            }
-
-        hp, cp = p.split(":", 1)
-        ports[cp] = hp
+    # Docker expects {container_port: host_port}
+    ports = {cp: hp for hp, cp in parsed_ports}
 
     # Extract Docker Compose parameters
     docker_params = extract_docker_params(img_data)
 
-    if docker_params:
+    if docker_params and logger.isEnabledFor(logging.INFO):
         logger.info("Using Docker Compose parameters: %s", list(docker_params.keys()))
 
     # Prepare base parameters
@@ -426,9 +618,12 @@ def start_single_container_sync(container_name: str, img_data: Dict[str, Any], o
     if "hostname" not in docker_params:
         base_params["hostname"] = container_name
 
-    # Create and run container
+    # Create and run container (launched_at bounds the event replay window,
+    # so it must be taken before containers.run)
     try:
+        ensure_network()
         update_phase("launching")
+        launched_at = time.time()
         logger.info("Running Docker image: %s as %s", img_data["image"], full_container_name)
         container = docker_client.containers.run(
             img_data["image"],
@@ -441,6 +636,7 @@ def start_single_container_sync(container_name: str, img_data: Dict[str, Any], o
         try:
             docker_client.images.pull(img_data["image"])
             update_phase("launching")
+            launched_at = time.time()
             container = docker_client.containers.run(
                 img_data["image"],
                 **base_params,
@@ -451,6 +647,8 @@ def start_single_container_sync(container_name: str, img_data: Dict[str, Any], o
             logger.error("%s: %s", container_name, error_msg)
             return {"status": "failed", "name": container_name, "error": error_msg}
     except docker.errors.APIError as e:
+        # The network may have been removed behind our back: re-check it next time
+        invalidate_network()
         error_msg = f"Docker API error: {str(e)}"
         logger.error("%s: %s", container_name, error_msg)
         return {"status": "failed", "name": container_name, "error": error_msg}
@@ -458,78 +656,57 @@ def start_single_container_sync(container_name: str, img_data: Dict[str, Any], o
     # Wait for container to be running
     update_phase("waiting_ready")
     max_wait = TimeoutConfig.CONTAINER_START_TIMEOUT
-    elapsed = 0
-    wait_interval = TimeoutConfig.CONTAINER_START_POLL_INTERVAL
     start_time = time.time()
 
-    logger.debug("Polling container status (max %ds, interval %.2fs)", max_wait, wait_interval)
-    
-    while elapsed < max_wait:
+    try:
+        status = wait_for_container_status(container, max_wait, launched_at)
+    except docker.errors.NotFound:
+        error_msg = "Container disappeared after creation"
+        logger.error("%s: %s", container_name, error_msg)
+        return {"status": "failed", "name": container_name, "error": error_msg}
+
+    if status == "running":
+        elapsed_time = time.time() - start_time
+        logger.info("Container %s is now running (took %.2fs)", full_container_name, elapsed_time)
+
+        # Execute post-start script
+        post_start_script = (img_data.get('scripts') or {}).get('post_start')
+
         try:
-            container.reload()
-            
-            if container.status == "running":
-                elapsed_time = time.time() - start_time
-                logger.info("Container %s is now running (took %.2fs)", full_container_name, elapsed_time)
-                
-                # Execute post-start script
-                scripts = img_data.get('scripts', {})
-                post_start_script = scripts.get('post_start') if scripts else None
+            update_phase("running_post_start")
+            logger.info(">>> CALLING post_start script for %s", full_container_name)
 
-                try:
-                    update_phase("running_post_start")
-                    logger.info(">>> CALLING post_start script for %s", full_container_name)
+            if operation_id:
+                add_script_tracking(operation_id, full_container_name, "post_start")
 
-                    if operation_id:
-                        add_script_tracking(operation_id, full_container_name, "post_start")
+            execute_script(post_start_script, full_container_name, container_name, script_type="init")
+            logger.info(">>> post_start script COMPLETED successfully for %s", full_container_name)
 
-                    execute_script(post_start_script, full_container_name, container_name, script_type="init")
-                    logger.info(">>> post_start script COMPLETED successfully for %s", full_container_name)
+            if operation_id:
+                complete_script_tracking(operation_id, full_container_name)
+        except Exception as script_error:
+            logger.error(">>> post_start script FAILED for %s: %s", full_container_name, str(script_error))
 
-                    if operation_id:
-                        complete_script_tracking(operation_id, full_container_name)
-                except Exception as script_error:
-                    logger.error(">>> post_start script FAILED for %s: %s", full_container_name, str(script_error))
+            if operation_id:
+                complete_script_tracking(operation_id, full_container_name)
 
-                    if operation_id:
-                        complete_script_tracking(operation_id, full_container_name)
+        update_phase("completed")
+        return {"status": "started", "name": container_name}
 
-                update_phase("completed")
-                return {"status": "started", "name": container_name}
-            
-            elif container.status in ["exited", "dead"]:
-                error_msg = f"Container failed to start: {container.status}"
-                logger.error("%s: %s", container_name, error_msg)
-                
-                # Try to get exit logs
-                try:
-                    logs = container.logs(tail=10).decode('utf-8', errors='replace')
-                    logger.error("Container logs: %s", logs[:500])  # Log first 500 chars
-                except Exception as e:
-                    logger.warning("Could not get container logs: %s", str(e))
-                
-                return {"status": "failed", "name": container_name, "error": error_msg}
-        
-        except docker.errors.NotFound:
-            error_msg = "Container disappeared after creation"
-            logger.error("%s: %s", container_name, error_msg)
-            return {"status": "failed", "name": container_name, "error": error_msg}
+    if status in ["exited", "dead"]:
+        error_msg = f"Container failed to start: {status}"
+        logger.error("%s: %s", container_name, error_msg)
+
+        # Try to get exit logs
+        try:
+            logs = container.logs(tail=10).decode('utf-8', errors='replace')
+            logger.error("Container logs: %s", logs[:500])  # Log first 500 chars
         except Exception as e:
-            logger.warning("Error checking container status: %s", str(e))
-        
-        time.sleep(wait_interval)
-        elapsed = time.time() - start_time
-        
-        if elapsed % 5 < wait_interval:  # Log every ~5 seconds
-            logger.debug("Still waiting for %s (elapsed: %.1fs/%ds)", container_name, elapsed, max_wait)
-    
+            logger.warning("Could not get container logs: %s", str(e))
+
+        return {"status": "failed", "name": container_name, "error": error_msg}
+
     # Timeout reached
-    try:
-        container.reload()
-        status = container.status
-    except:
-        status = "unknown"
-    
     error_msg = f"Container did not start within {max_wait}s timeout (status: {status})"
     logger.error("%s: %s", container_name, error_msg)
     return {"status": "failed", "name": container_name, "error": error_msg}
@@ -551,9 +728,6 @@ def stop_single_container_sync(container_name: str, img_data: Dict[str, Any], op
         - "not_running": Container was not running
         - "failed": Container failed to stop
     """
-    from src.web.core.scripts import execute_script
-    from src.web.core.state import add_script_tracking, complete_script_tracking, update_operation
-
     base_container_name = to_display_name(container_name)
     full_container_name = to_full_name(container_name)
 
@@ -575,8 +749,7 @@ def stop_single_container_sync(container_name: str, img_data: Dict[str, Any], op
 
         # Execute pre-stop script
         update_phase("running_pre_stop")
-        scripts = img_data.get('scripts', {})
-        pre_stop_script = scripts.get('pre_stop') if scripts else None
+        pre_stop_script = (img_data.get('scripts') or {}).get('pre_stop')
 
         try:
             logger.info(">>> CALLING pre_stop script for %s", full_container_name)
@@ -638,19 +811,17 @@ def has_default_script(container_name: str, script_type: str) -> bool:
     Returns:
         bool: True if default script exists
     """
-    full_container_name = to_full_name(container_name)
-    script_name = f"{container_name}/{full_container_name}-{script_type}.sh"
-    script_path = SCRIPTS_DIR / script_name
-    return script_path.exists()
+    return find_default_script(container_name, script_type) is not None
 
 
 def get_container_features(image_name: str, config: Dict[str, Any]) -> Dict[str, bool]:
     """Get special features of a container, including default scripts"""
-    img_data = config.get(image_name, {})
+    img_data = config.get(image_name) or {}
+    scripts = img_data.get('scripts') or {}
     
     # Check for YAML configured scripts
-    has_yaml_post_start = bool(img_data.get('scripts', {}).get('post_start'))
-    has_yaml_pre_stop = bool(img_data.get('scripts', {}).get('pre_stop'))
+    has_yaml_post_start = bool(scripts.get('post_start'))
+    has_yaml_pre_stop = bool(scripts.get('pre_stop'))
     
     # Check for default scripts
     has_default_post_start = has_default_script(image_name, 'init')
@@ -658,7 +829,7 @@ def get_container_features(image_name: str, config: Dict[str, Any]) -> Dict[str,
     
     return {
         'has_motd': bool(img_data.get('motd')),
-        'has_scripts': bool(img_data.get('scripts')) or has_default_post_start or has_default_pre_stop,
+        'has_scripts': bool(scripts) or has_default_post_start or has_default_pre_stop,
         'has_post_start': has_yaml_post_start or has_default_post_start,
         'has_pre_stop': has_yaml_pre_stop or has_default_pre_stop,
         'has_default_post_start': has_default_post_start,
@@ -672,8 +843,9 @@ def get_container_volumes(container_name: str) -> Dict[str, str]:
     container_name = to_full_name(container_name)
 
     try:
-        cont = docker_client.containers.get(container_name)
-        mounts = cont.attrs.get('Mounts', [])
+        # Low-level inspect: we only need the raw Mounts list, not a Container object
+        data = low_client.inspect_container(container_name)
+        mounts = data.get('Mounts') or []
         
         volumes_info = {}
         for mount in mounts:
@@ -688,11 +860,12 @@ def get_container_volumes(container_name: str) -> Dict[str, str]:
                 volumes_info[container_path] = f"[bind] {source}"
         
         return volumes_info
-    except:
+    except docker.errors.NotFound:
         return {}
 
 
-ensure_network()
+# The network is checked lazily (startup event / first container start), so
+# importing this module never blocks on the Docker daemon
 logger.info("Docker operations module loaded successfully")
 logger.info("Shared directory: %s", SHARED_DIR)
 logger.info("Network: %s", NETWORK_NAME)
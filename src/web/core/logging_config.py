@@ -1,9 +1,23 @@
 """Centralized logging configuration for the application"""
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+# Background thread writing queued records to the log file
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush pending records and stop the file-writer thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output"""
@@ -19,10 +33,17 @@ class ColoredFormatter(logging.Formatter):
     }
 
     def format(self, record):
-        # Add color to levelname
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
-        return super().format(record)
+        # Add color to levelname, restoring it afterwards so other handlers
+        # (e.g. the file handler) see the plain level name
+        levelname = record.levelname
+        if levelname not in self.COLORS:
+            return super().format(record)
+
+        record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging(
@@ -40,6 +61,7 @@ def setup_logging(
         file_level: Logging level for file output
         format_style: Format style ('standard' or 'detailed')
     """
+    global _queue_listener
 
     # Default log file location
     if log_file is None:
@@ -66,18 +88,28 @@ def setup_logging(
 
     # Remove any existing handlers to avoid duplicates
     root_logger.handlers.clear()
+    _stop_queue_listener()
 
-    # Create file handler
+    # Create file handler, fed through a queue so that request threads never
+    # block on disk I/O. Rotation stays with start-webui.sh, which also
+    # appends uvicorn's stdout to the same file.
     file_handler = logging.FileHandler(str(log_file), mode='a', encoding='utf-8')
     file_handler.setLevel(file_level)
     file_formatter = logging.Formatter(file_format, datefmt=date_format)
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
 
-    # Create console handler with colors
+    queue_handler = QueueHandler(queue.Queue(-1))
+    queue_handler.setLevel(file_level)
+    root_logger.addHandler(queue_handler)
+
+    _queue_listener = QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+    _queue_listener.start()
+
+    # Create console handler (colors only when attached to a terminal)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(console_level)
-    console_formatter = ColoredFormatter(console_format, datefmt=date_format)
+    console_formatter_cls = ColoredFormatter if sys.stdout.isatty() else logging.Formatter
+    console_formatter = console_formatter_cls(console_format, datefmt=date_format)
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
 
@@ -99,6 +131,9 @@ def setup_logging(
     logger.info("=" * 80)
 
 
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
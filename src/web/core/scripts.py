@@ -3,9 +3,21 @@
 """Script execution for container lifecycle management"""
 from pathlib import Path
 import subprocess
+import shutil
 import os
+import atexit
 import logging
+import queue
+import random
+import selectors
+import shlex
+import signal
+import tempfile
+import threading
 import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 from .logging_config import get_module_logger
@@ -26,9 +38,12 @@ class ScriptConfig:
     SCRIPT_HALT_TIMEOUT = int(os.getenv('PLAYGROUND_SCRIPT_HALT_TIMEOUT', '300'))   # pre-stop
 
     # Retry settings
-    ENABLE_SCRIPT_RETRY = True
+    # When disabled, default + custom file scripts run batched in one bash process
+    ENABLE_SCRIPT_RETRY = os.getenv('PLAYGROUND_SCRIPT_RETRY', 'true').lower() == 'true'
     MAX_SCRIPT_RETRIES = 2
-    RETRY_DELAY_SECONDS = 2
+    RETRY_BACKOFF_BASE = 0.5  # seconds, doubled on each attempt
+    RETRY_BACKOFF_CAP = 10    # max backoff before jitter
+    RETRY_JITTER = 0.5        # random extra delay to spread simultaneous retries
 
     # Logging
     ENABLE_SCRIPT_OUTPUT_LOGGING = os.getenv('PLAYGROUND_SCRIPT_OUTPUT_LOGGING', 'true').lower() == 'true'
@@ -37,6 +52,21 @@ class ScriptConfig:
     # Environment
     PRESERVE_ENV = True  # Preserve parent environment variables
 
+    # Grace period between SIGTERM and SIGKILL when a script times out
+    SIGTERM_GRACE = int(os.getenv('PLAYGROUND_SCRIPT_SIGTERM_GRACE', '10'))  # seconds
+
+    # Run default and custom scripts concurrently (off by default: custom
+    # scripts commonly depend on what the default script set up)
+    PARALLEL_SCRIPTS = os.getenv('PLAYGROUND_PARALLEL_SCRIPTS', 'false').lower() == 'true'
+
+    # Run inline scripts in a persistent per-container bash instead of
+    # spawning a new one each time (off by default)
+    PERSISTENT_SHELL = os.getenv('PLAYGROUND_PERSISTENT_SHELL', 'false').lower() == 'true'
+    BASH_WORKER_IDLE_TIMEOUT = int(os.getenv('PLAYGROUND_BASH_WORKER_IDLE_TIMEOUT', '300'))  # seconds
+
+    # Default script discovery
+    DEFAULT_SCRIPTS_CACHE_TTL = int(os.getenv('PLAYGROUND_SCRIPTS_CACHE_TTL', '30'))  # seconds
+
     @classmethod
     def get_timeout(cls, script_type: str) -> int:
         """Get appropriate timeout based on script type
@@ -54,17 +84,39 @@ class ScriptConfig:
         else:
             return cls.SCRIPT_EXECUTION_TIMEOUT
 
+    @classmethod
+    def get_retry_delay(cls, attempt: int) -> float:
+        """Get the delay before retrying after a failed attempt
+
+        Exponential backoff capped at RETRY_BACKOFF_CAP, plus random jitter.
+
+        Args:
+            attempt: Attempt number that just failed (1-based)
+
+        Returns:
+            float: Delay in seconds
+        """
+        backoff = min(cls.RETRY_BACKOFF_BASE * 2 ** (attempt - 1), cls.RETRY_BACKOFF_CAP)
+        return backoff + random.uniform(0, cls.RETRY_JITTER)
+
+    _logged = False
+
     @classmethod
     def log_config(cls):
-        """Log configuration on startup"""
+        """Log configuration on startup (once, even if the module is re-imported)"""
+        if cls._logged:
+            return
+        cls._logged = True
         logger.info("Script Configuration:")
         logger.info("  Default timeout: %ds", cls.SCRIPT_EXECUTION_TIMEOUT)
         logger.info("  Init (post-start) timeout: %ds", cls.SCRIPT_INIT_TIMEOUT)
         logger.info("  Halt (pre-stop) timeout: %ds", cls.SCRIPT_HALT_TIMEOUT)
-        logger.info("  Retry: %s (max %d retries, %ds delay)",
+        logger.info("  Retry: %s (max %d retries, backoff %.1fs-%ds + %.1fs jitter)",
                    "ENABLED" if cls.ENABLE_SCRIPT_RETRY else "DISABLED",
                    cls.MAX_SCRIPT_RETRIES,
-                   cls.RETRY_DELAY_SECONDS)
+                   cls.RETRY_BACKOFF_BASE,
+                   cls.RETRY_BACKOFF_CAP,
+                   cls.RETRY_JITTER)
         logger.info("  Output logging: %s (max %d lines per script)",
                    "ENABLED" if cls.ENABLE_SCRIPT_OUTPUT_LOGGING else "DISABLED",
                    cls.MAX_OUTPUT_LINES)
@@ -72,15 +124,137 @@ class ScriptConfig:
 BASE_DIR = Path(__file__).parent.parent.parent.parent
 SCRIPTS_DIR = BASE_DIR / "scripts"
 SHARED_DIR = BASE_DIR / "shared-volumes"
+SCRIPTS_DIR_STR = str(SCRIPTS_DIR)
+SHARED_DIR_STR = str(SHARED_DIR)
+
+# Resolve bash once so each exec doesn't walk $PATH
+_BASH = shutil.which('bash') or '/bin/bash'
 
 # Log config on module load
 ScriptConfig.log_config()
 
 
+# ============================================================
+# HELPER: Default script discovery
+# ============================================================
+
+# (container_name, script_type) -> (absolute path, path relative to SCRIPTS_DIR),
+# both plain str; rebuilt after DEFAULT_SCRIPTS_CACHE_TTL
+_SCRIPT_INDEX: Optional[dict] = None
+_script_index_time = 0.0
+_script_index_lock = threading.Lock()
+
+
+def _scan_sh_files(directory: str):
+    """Yield (stem, filename) for every shell script directly inside directory"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.sh') and entry.is_file():
+                yield entry.name[:-3], entry.name
+
+
+def _build_script_index() -> dict:
+    """Scan SCRIPTS_DIR once and index every default script
+
+    Covers both supported layouts, stack-specific scripts taking precedence:
+    - stacks/{container_name}/{script_type}.sh
+    - {script_type}/{container_name}.sh
+
+    Returns:
+        dict: (container_name, script_type) -> (absolute path, relative path)
+    """
+    simple = {}
+    stacks = {}
+    try:
+        with os.scandir(SCRIPTS_DIR) as top_entries:
+            for top in top_entries:
+                if not top.is_dir():
+                    continue
+                if top.name == "stacks":
+                    with os.scandir(top.path) as stack_dirs:
+                        for stack in stack_dirs:
+                            if stack.is_dir():
+                                for script_type, filename in _scan_sh_files(stack.path):
+                                    stacks[(stack.name, script_type)] = (
+                                        os.path.join(stack.path, filename),
+                                        f"stacks/{stack.name}/{filename}")
+                else:
+                    for container_name, filename in _scan_sh_files(top.path):
+                        simple[(container_name, top.name)] = (
+                            os.path.join(top.path, filename), f"{top.name}/{filename}")
+    except FileNotFoundError:
+        logger.warning("Scripts directory not found: %s", SCRIPTS_DIR)
+    except OSError as e:
+        logger.warning("Error scanning scripts directory %s: %s", SCRIPTS_DIR, str(e))
+
+    simple.update(stacks)
+    logger.debug("Default scripts index rebuilt: %d scripts", len(simple))
+    return simple
+
+
+def _get_script_index() -> dict:
+    """Get the default script index, rebuilding it after the TTL"""
+    global _SCRIPT_INDEX, _script_index_time
+
+    with _script_index_lock:
+        now = time.time()
+        if (_SCRIPT_INDEX is None or
+                now - _script_index_time > ScriptConfig.DEFAULT_SCRIPTS_CACHE_TTL):
+            _SCRIPT_INDEX = _build_script_index()
+            _script_index_time = now
+        return _SCRIPT_INDEX
+
+
+def invalidate_default_scripts_cache() -> None:
+    """Force the next lookup to rescan SCRIPTS_DIR
+
+    Called by core.config whenever the configuration is reloaded from disk,
+    so scripts added alongside new config show up without waiting for
+    DEFAULT_SCRIPTS_CACHE_TTL.
+    """
+    global _SCRIPT_INDEX
+    with _script_index_lock:
+        _SCRIPT_INDEX = None
+
+
+def find_default_script(container_name: str, script_type: str) -> Optional[str]:
+    """Find the default script for a container
+
+    Args:
+        container_name: Container name without prefix (e.g., 'mysql-8.0')
+        script_type: 'init' or 'halt'
+
+    Returns:
+        str or None: Script path relative to SCRIPTS_DIR, None if there is none
+    """
+    entry = _get_script_index().get((container_name, script_type))
+    return entry[1] if entry else None
+
+
+# Build the index at startup so the first container start doesn't pay for it
+_get_script_index()
+
+
 # ============================================================
 # HELPER: Build script environment
 # ============================================================
 
+# Base environment shared by every script run; per-run keys are added on a copy
+_ENV_TEMPLATE: dict = {}
+
+
+def refresh_env_template() -> None:
+    """Rebuild the script environment template (call after mutating os.environ)"""
+    global _ENV_TEMPLATE
+    template = dict(os.environ) if ScriptConfig.PRESERVE_ENV else {}
+    template['SHARED_DIR'] = SHARED_DIR_STR
+    template['SCRIPTS_DIR'] = SCRIPTS_DIR_STR
+    _ENV_TEMPLATE = template
+
+
+refresh_env_template()
+
+
 def build_script_environment(container_name: str) -> dict:
     """Build environment variables for script execution
     
@@ -90,192 +264,815 @@ def build_script_environment(container_name: str) -> dict:
     Returns:
         dict: Environment variables
     """
-    env = {}
-    
-    # Preserve parent environment if enabled
-    if ScriptConfig.PRESERVE_ENV:
-        env.update(os.environ)
-    
-    # Add custom variables
+    env = _ENV_TEMPLATE.copy()
     env['CONTAINER_NAME'] = container_name
-    env['SHARED_DIR'] = str(SHARED_DIR)
-    env['SCRIPTS_DIR'] = str(SCRIPTS_DIR)
     env['TIMESTAMP'] = str(int(time.time()))
-    
     return env
 
 
+# ============================================================
+# HELPER: Format script output for logging
+# ============================================================
+
+def _format_output_block(title: str, output_lines, total_lines: int) -> str:
+    """Build one multi-line log message for a script's output
+
+    Emitting a single record instead of one per line keeps the log
+    lock and write() calls per script constant.
+
+    Args:
+        title: Block title (e.g., 'INIT SCRIPT OUTPUT')
+        output_lines: Last MAX_OUTPUT_LINES lines of stdout/stderr
+        total_lines: Number of lines the script produced in total
+
+    Returns:
+        str: Output framed by separator lines
+    """
+    separator = "=" * 60
+    body = "\n".join(f"  {line.rstrip()}" for line in output_lines if line.strip())
+
+    omitted = total_lines - len(output_lines)
+    if omitted > 0:
+        body = f"  ... ({omitted} earlier lines omitted)\n{body}"
+
+    return f"\n{separator}\n{title}:\n{separator}\n{body}\n{separator}"
+
+
+class _TailBuffer:
+    """Keep the last MAX_OUTPUT_LINES lines of a stream plus a total count"""
+
+    def __init__(self):
+        self.lines = deque(maxlen=ScriptConfig.MAX_OUTPUT_LINES)
+        self.total_lines = 0
+
+    def append(self, line: str) -> None:
+        self.lines.append(line)
+        self.total_lines += 1
+
+    @property
+    def text(self) -> str:
+        return "".join(self.lines)
+
+
+class _OutputTail(_TailBuffer):
+    """Drain a pipe in a background thread, keeping only the last lines
+
+    Memory stays bounded by MAX_OUTPUT_LINES however much a script prints.
+    """
+
+    def __init__(self, pipe):
+        super().__init__()
+        self._pipe = pipe
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        with self._pipe:
+            for line in self._pipe:
+                self.append(line)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the pipe to close; returns False if it's still open"""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+
+# ============================================================
+# HELPER: Persistent bash workers for inline scripts
+# ============================================================
+
+class _BashWorker:
+    """Long-lived `bash -s` shell that runs inline scripts for one container
+
+    Each script runs in a subshell of the worker, so `exit`, `cd` and
+    variables don't leak between runs, while fork+exec and shell startup
+    are paid once per worker instead of once per script. Output of each
+    run ends with a unique sentinel line carrying the exit code.
+    """
+
+    def __init__(self, container_name: str):
+        self.container_name = container_name
+        self.last_used = time.time()
+        self.lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            [_BASH, '-s'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=build_script_environment(container_name),
+            cwd=SCRIPTS_DIR_STR,
+            close_fds=False,
+            start_new_session=True
+        )
+        self._stdout = queue.Queue()
+        self._stderr = queue.Queue()
+        for pipe, lines in ((self._proc.stdout, self._stdout), (self._proc.stderr, self._stderr)):
+            threading.Thread(target=self._pump, args=(pipe, lines), daemon=True).start()
+
+    @staticmethod
+    def _pump(pipe, lines: "queue.Queue") -> None:
+        with pipe:
+            for line in pipe:
+                lines.put(line)
+        lines.put(None)  # EOF: the worker shell exited
+
+    def is_alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def run(self, script_name: str, script_content: str, timeout: float):
+        """Run an inline script and wait for its sentinel
+
+        Args:
+            script_name: Name shown as $0 in error messages (bash 5+, as with `bash -c`)
+            script_content: Inline script body
+            timeout: Seconds before the worker is killed
+
+        Returns:
+            tuple: (exit_code, stdout _TailBuffer, stderr _TailBuffer)
+
+        Raises:
+            subprocess.TimeoutExpired: If the script doesn't finish in time
+            RuntimeError: If the worker shell died mid-run
+        """
+        sentinel = f"__PLAYGROUND_END_{uuid.uuid4().hex}__"
+        # $0 is the script name (BASH_ARGV0, bash 5+) and $1 the container
+        # name, as with `bash -c`; stdin is detached so the script can't
+        # consume the worker's command stream
+        command = (
+            f"( BASH_ARGV0={shlex.quote(script_name)}; "
+            f"set -- {shlex.quote(self.container_name)}; "
+            f"export TIMESTAMP=$(date +%s); "
+            f"eval {shlex.quote(script_content)} ) </dev/null; "
+            f"echo \"{sentinel} $?\"; echo \"{sentinel}\" >&2\n"
+        )
+        self.last_used = time.time()
+        self._proc.stdin.write(command)
+        self._proc.stdin.flush()
+
+        deadline = time.time() + timeout
+        stdout_tail = _TailBuffer()
+        stderr_tail = _TailBuffer()
+        exit_line = self._read_until(self._stdout, sentinel, stdout_tail, deadline, script_name, timeout)
+        self._read_until(self._stderr, sentinel, stderr_tail, deadline, script_name, timeout)
+        self.last_used = time.time()
+        return int(exit_line.split()[1]), stdout_tail, stderr_tail
+
+    def _read_until(self, lines: "queue.Queue", sentinel: str, tail: _TailBuffer,
+                    deadline: float, script_name: str, timeout: float) -> str:
+        while True:
+            try:
+                line = lines.get(timeout=max(deadline - time.time(), 0))
+            except queue.Empty:
+                # Same SIGTERM -> grace -> SIGKILL path as spawned scripts
+                _terminate_script(self._proc)
+                raise subprocess.TimeoutExpired(script_name, timeout)
+            if line is None:
+                raise RuntimeError("bash worker exited before the script finished")
+            pos = line.find(sentinel)
+            if pos == -1:
+                tail.append(line)
+                continue
+            # Output without a trailing newline shares the sentinel's line
+            if pos:
+                tail.append(line[:pos])
+            return line[pos:]
+
+    def close(self) -> None:
+        if self.is_alive():
+            # Kill the whole group so a running script's children go too
+            _signal_group(self._proc, signal.SIGKILL)
+            self._proc.wait()
+
+
+_bash_workers: dict = {}
+_bash_workers_lock = threading.Lock()
+
+
+def _get_bash_worker(container_name: str) -> _BashWorker:
+    """Get (or start) the worker for a container, evicting idle ones"""
+    now = time.time()
+    with _bash_workers_lock:
+        for name, worker in list(_bash_workers.items()):
+            idle = now - worker.last_used > ScriptConfig.BASH_WORKER_IDLE_TIMEOUT
+            if not worker.is_alive() or (idle and not worker.lock.locked()):
+                worker.close()
+                del _bash_workers[name]
+
+        worker = _bash_workers.get(container_name)
+        if worker is None:
+            worker = _BashWorker(container_name)
+            _bash_workers[container_name] = worker
+        return worker
+
+
+def _discard_bash_worker(worker: _BashWorker) -> None:
+    """Kill a worker and drop it from the pool"""
+    worker.close()
+    with _bash_workers_lock:
+        if _bash_workers.get(worker.container_name) is worker:
+            del _bash_workers[worker.container_name]
+
+
+def close_bash_workers() -> None:
+    """Kill all persistent bash workers"""
+    with _bash_workers_lock:
+        for worker in _bash_workers.values():
+            worker.close()
+        _bash_workers.clear()
+
+
+atexit.register(close_bash_workers)
+
+
 # ============================================================
 # HELPER: Execute script with error handling
 # ============================================================
 
+def _signal_group(proc, sig) -> None:
+    """Send a signal to a script's whole process group (bash and its children)"""
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def _terminate_script(proc) -> None:
+    """Stop a timed-out script: SIGTERM its group, then SIGKILL after the grace period
+
+    The grace period lets scripts clean up (flush DB state, remove lock
+    files) instead of being killed mid-write.
+    """
+    _signal_group(proc, signal.SIGTERM)
+    try:
+        proc.wait(timeout=ScriptConfig.SIGTERM_GRACE)
+    except subprocess.TimeoutExpired:
+        logger.warning("Script pid %d ignored SIGTERM for %ds, sending SIGKILL",
+                      proc.pid, ScriptConfig.SIGTERM_GRACE)
+        _signal_group(proc, signal.SIGKILL)
+        proc.wait()
+
+
+def _wait_process(proc, timeout: float) -> int:
+    """Wait for a process to exit, raising TimeoutExpired after timeout
+
+    Popen.wait(timeout) polls with sleeps of up to 50ms, which adds latency
+    to every short script. A pidfd (Linux 5.3+) becomes readable the moment
+    the process exits, so one select() replaces the polling loop.
+    """
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        return proc.wait(timeout=timeout)
+
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(pidfd, selectors.EVENT_READ)
+            if not selector.select(timeout):
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+    finally:
+        os.close(pidfd)
+    return proc.wait()
+
+
+def _spawn_script(command: list, env: dict, timeout: float):
+    """Run a script in a fresh bash process
+
+    Returns:
+        tuple: (start_time, exit_code, stdout _OutputTail, stderr _OutputTail)
+    """
+    # Execute script, streaming output so only the tail is kept in memory.
+    # close_fds=False skips walking the server's FD table on every spawn;
+    # Python opens FDs non-inheritable (PEP 446), so nothing leaks to scripts.
+    # Without preexec_fn/user/group CPython spawns via vfork(), so the
+    # server's page tables aren't copied; keep it that way.
+    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    proc = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        cwd=SCRIPTS_DIR_STR,
+        close_fds=False,
+        start_new_session=True
+    )
+    stdout_tail = _OutputTail(proc.stdout)
+    stderr_tail = _OutputTail(proc.stderr)
+    try:
+        returncode = _wait_process(proc, timeout)
+    except subprocess.TimeoutExpired:
+        _terminate_script(proc)
+        _close_output(proc, stdout_tail, stderr_tail)
+        raise
+    
+    # Background children (`sleep 60 &`) inherit the pipes and keep them
+    # open after bash exits: wait for them only until the script's deadline
+    if not (stdout_tail.join(max(0.0, deadline - time.monotonic())) and
+            stderr_tail.join(max(0.0, deadline - time.monotonic()))):
+        logger.warning("Script pid %d exited but its background processes kept "
+                      "running past the %ss timeout, killing its session", proc.pid, timeout)
+        _signal_group(proc, signal.SIGTERM)
+        _close_output(proc, stdout_tail, stderr_tail)
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    return start_time, returncode, stdout_tail, stderr_tail
+
+
+def _close_output(proc, stdout_tail: "_OutputTail", stderr_tail: "_OutputTail") -> None:
+    """Wait briefly for a stopped script's pipes to close, SIGKILLing leftovers
+
+    Children that ignored SIGTERM may still hold the pipes; after the grace
+    period the whole session is killed so the reader threads can finish.
+    """
+    grace = time.monotonic() + ScriptConfig.SIGTERM_GRACE
+    if (stdout_tail.join(max(0.0, grace - time.monotonic())) and
+            stderr_tail.join(max(0.0, grace - time.monotonic()))):
+        return
+    _signal_group(proc, signal.SIGKILL)
+    stdout_tail.join(timeout=1)
+    stderr_tail.join(timeout=1)
+
+
+def _run_in_bash_worker(container_name: str, script_name: str, script_content: str, timeout: float):
+    """Run an inline script in the container's persistent bash worker
+
+    Returns:
+        tuple: (exit_code, stdout _TailBuffer, stderr _TailBuffer)
+    """
+    worker = _get_bash_worker(container_name)
+    with worker.lock:
+        try:
+            return worker.run(script_name, script_content, timeout)
+        except Exception:
+            _discard_bash_worker(worker)
+            raise
+
+
+def _build_command(script_path: str, container_name: str, script_content: Optional[str],
+                   script_name: Optional[str] = None):
+    """Build the bash command line for a script file or inline script
+
+    Returns:
+        tuple: (script_name, command)
+    """
+    if script_name is None:
+        script_name = os.path.basename(script_path)
+    if script_content is None:
+        return script_name, [_BASH, script_path, container_name]
+    # $0 is the script name, $1 the container name (same as a script file)
+    return script_name, [_BASH, '-c', script_content, script_name, container_name]
+
+
+def _log_script_run(level: int, message: str, args: tuple, result: dict,
+                    script_type: str, script_name: str, attempt: int) -> None:
+    """Emit the single end-of-run record for one script attempt
+
+    Key fields are attached as structured extras (script_name, script_type,
+    attempt, status, exit_code, elapsed) for formatters that render them.
+    """
+    logger.log(level, message, *args, extra={
+        "script_name": script_name,
+        "script_type": script_type,
+        "attempt": attempt,
+        "status": result["status"],
+        "exit_code": result["exit_code"],
+        "elapsed": result["elapsed"],
+    })
+
+
+def _script_result(script_type: str, script_name: str, attempt: int, returncode: int,
+                   elapsed: float, stdout_tail: _TailBuffer, stderr_tail: _TailBuffer) -> dict:
+    """Log a finished script run and build its result dict"""
+    result = {
+        "status": "success" if returncode == 0 else "failed",
+        "exit_code": returncode,
+        "stdout": stdout_tail.text,
+        "stderr": stderr_tail.text,
+        "elapsed": elapsed
+    }
+    
+    if returncode == 0:
+        # Output block goes in the same record; skip building it when INFO is filtered out
+        output = ""
+        if (ScriptConfig.ENABLE_SCRIPT_OUTPUT_LOGGING and stdout_tail.total_lines
+                and logger.isEnabledFor(logging.INFO)):
+            output = _format_output_block(f"{script_type.upper()} SCRIPT OUTPUT",
+                                          stdout_tail.lines, stdout_tail.total_lines)
+        _log_script_run(logging.INFO, "✓ %s script %s succeeded (attempt %d, exit code: 0, elapsed: %.2fs)%s",
+                        (script_type, script_name, attempt, elapsed, output),
+                        result, script_type, script_name, attempt)
+    else:
+        output = ""
+        if stderr_tail.total_lines and logger.isEnabledFor(logging.ERROR):
+            output = _format_output_block(f"{script_type.upper()} SCRIPT ERROR OUTPUT",
+                                          stderr_tail.lines, stderr_tail.total_lines)
+        _log_script_run(logging.ERROR, "✗ %s script %s failed (attempt %d, exit code: %d, elapsed: %.2fs)%s",
+                        (script_type, script_name, attempt, returncode, elapsed, output),
+                        result, script_type, script_name, attempt)
+    
+    return result
+
+
+def _timeout_result(script_type: str, script_name: str, attempt: int, timeout: int) -> dict:
+    result = {
+        "status": "timeout",
+        "exit_code": -1,
+        "stdout": "",
+        "stderr": f"Script execution timeout after {timeout} seconds",
+        "elapsed": timeout
+    }
+    _log_script_run(logging.ERROR, "✗ %s script %s TIMEOUT (attempt %d, exceeded %ds)",
+                    (script_type, script_name, attempt, timeout),
+                    result, script_type, script_name, attempt)
+    return result
+
+
+def _error_result(script_type: str, script_name: str, attempt: int, error: Exception) -> dict:
+    result = {
+        "status": "error",
+        "exit_code": -1,
+        "stdout": "",
+        "stderr": str(error),
+        "elapsed": 0
+    }
+    _log_script_run(logging.ERROR, "✗ %s script %s execution error (attempt %d): %s",
+                    (script_type, script_name, attempt, str(error)),
+                    result, script_type, script_name, attempt)
+    return result
+
+
 def _execute_script_internal(
     script_path: str,
     container_name: str,
     script_type: str = "init",
-    retry_attempt: int = 1
+    retry_attempt: int = 1,
+    script_content: Optional[str] = None,
+    script_name: Optional[str] = None,
+    timeout: Optional[int] = None
 ) -> dict:
     """Execute a single script with timeout and error handling
     
     Args:
-        script_path: Path to script file
+        script_path: Path to script file (or a display name for inline scripts)
         container_name: Full container name
         script_type: 'init' or 'halt'
         retry_attempt: Current retry attempt number
+        script_content: Inline script body, passed to `bash -c` instead of a file
+        script_name: Display name, precomputed by callers that retry (defaults to basename)
+        timeout: Seconds before the script is stopped (defaults to the script type's timeout)
     
     Returns:
         dict: Execution result with status, exit_code, stdout, stderr
     """
-    timeout = ScriptConfig.get_timeout(script_type)
-    script_name = Path(script_path).name
+    if timeout is None:
+        timeout = ScriptConfig.get_timeout(script_type)
+    script_name, command = _build_command(script_path, container_name, script_content, script_name)
     
-    logger.info(">> Executing %s script: %s (attempt %d/%d, timeout: %ds)",
-               script_type, script_name, retry_attempt,
-               ScriptConfig.MAX_SCRIPT_RETRIES + 1, timeout)
+    logger.debug(">> Executing %s script: %s (attempt %d/%d, timeout: %ds)",
+                script_type, script_name, retry_attempt,
+                ScriptConfig.MAX_SCRIPT_RETRIES + 1, timeout)
     
     try:
-        # Build environment
-        env = build_script_environment(container_name)
-        
-        # Execute script
-        start_time = time.time()
-        result = subprocess.run(
-            ['bash', script_path, container_name],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env=env,
-            cwd=SCRIPTS_DIR
-        )
-        elapsed = time.time() - start_time
-        
-        # Log results
-        if result.returncode == 0:
-            logger.info("✓ %s script succeeded (exit code: 0, elapsed: %.2fs)", script_type, elapsed)
-
-            # Log output if configured - now at INFO level for visibility
-            if ScriptConfig.ENABLE_SCRIPT_OUTPUT_LOGGING and result.stdout:
-                logger.info("=" * 60)
-                logger.info("%s SCRIPT OUTPUT:", script_type.upper())
-                logger.info("=" * 60)
-
-                # Split output into lines and log each line
-                output_lines = result.stdout.strip().split('\n')
-                for line in output_lines[:ScriptConfig.MAX_OUTPUT_LINES]:
-                    if line.strip():
-                        logger.info("  %s", line)
-
-                if len(output_lines) > ScriptConfig.MAX_OUTPUT_LINES:
-                    logger.info("  ... (%d more lines omitted)", len(output_lines) - ScriptConfig.MAX_OUTPUT_LINES)
-
-                logger.info("=" * 60)
+        if script_content is not None and ScriptConfig.PERSISTENT_SHELL:
+            # Inline script through the container's persistent bash worker
+            start_time = time.time()
+            returncode, stdout_tail, stderr_tail = _run_in_bash_worker(
+                container_name, script_name, script_content, timeout
+            )
         else:
-            logger.error("✗ %s script failed (exit code: %d, elapsed: %.2fs)",
-                        script_type, result.returncode, elapsed)
-
-            if result.stderr:
-                logger.error("=" * 60)
-                logger.error("%s SCRIPT ERROR OUTPUT:", script_type.upper())
-                logger.error("=" * 60)
-
-                error_lines = result.stderr.strip().split('\n')
-                for line in error_lines[:ScriptConfig.MAX_OUTPUT_LINES]:
-                    if line.strip():
-                        logger.error("  %s", line)
-
-                if len(error_lines) > ScriptConfig.MAX_OUTPUT_LINES:
-                    logger.error("  ... (%d more lines omitted)", len(error_lines) - ScriptConfig.MAX_OUTPUT_LINES)
-
-                logger.error("=" * 60)
+            env = build_script_environment(container_name)
+            start_time, returncode, stdout_tail, stderr_tail = _spawn_script(command, env, timeout)
+        elapsed = time.time() - start_time
         
-        return {
-            "status": "success" if result.returncode == 0 else "failed",
-            "exit_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "elapsed": elapsed
-        }
+        return _script_result(script_type, script_name, retry_attempt, returncode, elapsed,
+                              stdout_tail, stderr_tail)
     
     except subprocess.TimeoutExpired:
-        logger.error("✗ %s script TIMEOUT (exceeded %ds)", script_type, timeout)
-        return {
-            "status": "timeout",
-            "exit_code": -1,
-            "stdout": "",
-            "stderr": f"Script execution timeout after {timeout} seconds",
-            "elapsed": timeout
-        }
+        return _timeout_result(script_type, script_name, retry_attempt, timeout)
     
     except Exception as e:
-        logger.error("✗ %s script execution error: %s", script_type, str(e))
-        return {
-            "status": "error",
-            "exit_code": -1,
-            "stdout": "",
-            "stderr": str(e),
-            "elapsed": 0
-        }
+        return _error_result(script_type, script_name, retry_attempt, e)
 
 
 # ============================================================
-# MAIN: execute_script with retry logic
+# HELPER: Run one script entry with retries
 # ============================================================
 
-def execute_script(
-    script_config,
-    full_container_name: str,
-    container_name: str,
-    script_type: str = "init"
-) -> None:
-    """Execute post-start or pre-stop script with retry logic
+# Exit codes that retrying cannot fix: bash syntax/usage error (2),
+# not executable (126), command not found (127)
+_NON_RETRYABLE_EXIT_CODES = frozenset({2, 126, 127})
 
-    Executes scripts in the following order:
-    1. Default script if exists (using standardized structure)
-    2. Custom script from YAML config if provided
 
-    Both scripts are executed if they exist. Failed scripts trigger retries if enabled.
+def _is_non_retryable(result: dict) -> bool:
+    """Check whether a failed script result should skip remaining retries"""
+    # 'error' means the script could not be launched at all (Python exception)
+    if result['status'] == 'error':
+        return True
+    return result['status'] == 'failed' and result['exit_code'] in _NON_RETRYABLE_EXIT_CODES
+
+
+def _prepare_script_entry(script_entry: dict, full_container_name: str):
+    """Resolve a default/custom script entry into what the runner needs
+
+    Returns:
+        tuple or None: (kind, script_path, script_name, script_content, description),
+        None if the script can't be run. Path and name are computed once here
+        so retries don't rebuild them.
+    """
+    script_to_execute = script_entry['config']
+    script_label = script_entry['label']
+    
+    if isinstance(script_to_execute, dict) and 'inline' in script_to_execute:
+        # Inline scripts run in memory, no temp file
+        # (CONTAINER_NAME and SHARED_DIR come from the environment)
+        script_name = f"{full_container_name}-{script_label}-inline.sh"
+        return 'inline', script_name, script_name, script_to_execute['inline'], ""
+    
+    if isinstance(script_to_execute, str):
+        # Default scripts carry their absolute path from the index
+        script_path = script_entry.get('path') or os.path.join(SCRIPTS_DIR_STR, script_to_execute)
+        # Default scripts come from the directory index, no need to stat them again
+        if script_label != 'default' and not os.path.exists(script_path):
+            logger.warning("Script file not found: %s", script_path)
+            return None
+        return ('file', script_path, os.path.basename(script_path), None,
+                f": {script_to_execute}")
+    
+    logger.warning("Unsupported %s script config for %s: %r",
+                  script_label, full_container_name, script_to_execute)
+    return None
+
+
+def _retry_delay(result: dict, attempt: int, script_label: str, kind: str,
+                 max_attempts: int, retry_enabled: bool) -> Optional[float]:
+    """Decide what to do after an attempt
 
     Args:
-        script_config: Script configuration (dict, str, or None)
+        max_attempts/retry_enabled: ScriptConfig values read once by the caller
+
+    Returns:
+        float or None: Delay before the next attempt, None if the script succeeded
+
+    Raises:
+        Exception: If the script failed and won't be retried
+    """
+    if result['status'] == 'success':
+        logger.debug("✓ %s %s script SUCCEEDED", script_label, kind)
+        return None
+    
+    # Deterministic failures won't recover on retry
+    if _is_non_retryable(result):
+        logger.error("✗ %s %s script FAILED with non-retryable %s (exit code: %d), aborting retries",
+                   script_label, kind, result['status'], result['exit_code'])
+        raise Exception(f"{script_label} {kind} script failed: {result['stderr']}")
+    
+    if retry_enabled and attempt < max_attempts:
+        delay = ScriptConfig.get_retry_delay(attempt)
+        logger.warning("Retrying %s script after %.1fs delay (attempt %d/%d)",
+                     script_label, delay, attempt, max_attempts)
+        return delay
+    
+    logger.error("✗ %s %s script FAILED after %d attempt(s)",
+               script_label, kind, attempt)
+    raise Exception(f"{script_label} {kind} script failed: {result['stderr']}")
+
+
+def _new_result_entry(script_entry: dict) -> dict:
+    return {
+        'label': script_entry['label'],
+        'config': script_entry['config'],
+        'attempts': 0,
+        'results': []
+    }
+
+
+def _run_script_entry(script_entry: dict, full_container_name: str, script_type: str) -> dict:
+    """Run a single default/custom script entry, retrying on failure
+
+    Args:
+        script_entry: Entry with 'config' (path str or {'inline': ...}) and 'label'
         full_container_name: Full container name (e.g., 'playground-mysql-8.0')
-        container_name: Container name without prefix (e.g., 'mysql-8.0')
-        script_type: Type of script - 'init' (post-start) or 'halt' (pre-stop)
+        script_type: 'init' or 'halt'
+
+    Returns:
+        dict: Result entry with label, config, attempts and per-attempt results
 
     Raises:
-        Exception: If script execution fails after all retries
+        Exception: If the script fails after all retries
+    """
+    script_label = script_entry['label']
+    result_entry = _new_result_entry(script_entry)
+    
+    # Entries already resolved by the batch check carry their result, so
+    # missing files aren't looked up (and logged) twice
+    if 'prepared' in script_entry:
+        prepared = script_entry['prepared']
+    else:
+        prepared = _prepare_script_entry(script_entry, full_container_name)
+    if prepared is None:
+        return result_entry
+    kind, script_path, script_name, script_content, description = prepared
+    
+    def run_once(attempt: int) -> dict:
+        logger.debug("Executing %s %s %s script%s (attempt %d)",
+                    script_label, kind, script_type, description, attempt)
+        return _execute_script_internal(
+            script_path,
+            full_container_name,
+            script_type,
+            attempt,
+            script_content=script_content,
+            script_name=script_name
+        )
+    
+    return _run_with_retries(run_once, result_entry, kind)
+
+
+def _run_with_retries(run_once, result_entry: dict, kind: str) -> dict:
+    """Call run_once(attempt) until it succeeds or retries are exhausted
+
+    Args:
+        run_once: Callable taking the attempt number and returning a result dict
+        result_entry: Entry that collects attempts and per-attempt results
+        kind: 'inline' or 'file', for log messages
+
+    Returns:
+        dict: The filled result_entry
+
+    Raises:
+        Exception: If the script fails after all retries
+    """
+    script_label = result_entry['label']
+    max_attempts = ScriptConfig.MAX_SCRIPT_RETRIES + 1
+    retry_enabled = ScriptConfig.ENABLE_SCRIPT_RETRY
+    try:
+        for attempt in range(1, max_attempts + 1):
+            result_entry['attempts'] = attempt
+            result = run_once(attempt)
+            result_entry['results'].append(result)
+            
+            delay = _retry_delay(result, attempt, script_label, kind, max_attempts, retry_enabled)
+            if delay is None:
+                break
+            time.sleep(delay)
+    
+    except Exception as e:
+        logger.error("✗ %s script execution error: %s", script_label, str(e))
+        raise
+    
+    return result_entry
+
+
+# Runs one batched script ($1 path, $2 container name, $3 index) with its
+# own timeout. Scripts and the watchdog stay in the batch's process group,
+# so killing the batch still reaches a running script; on a script timeout
+# the watchdog signals the script's process tree. Exit codes and confirmed
+# timeouts go to $_status, a file the scripts themselves aren't told about.
+_BATCH_RUNNER = """
+_tree() {{
+    local c
+    echo "$1"
+    for c in $(cat /proc/"$1"/task/*/children 2>/dev/null); do _tree "$c"; done
+}}
+_run() {{
+    "$BASH" "$1" "$2" &
+    local pid=$!
+    (
+        trap 'kill $s 2>/dev/null; exit 0' TERM
+        sleep {timeout} & s=$!; wait $s
+        echo "$3 timeout" >> "$_status"
+        pids=$(_tree $pid)
+        kill -TERM $pids 2>/dev/null
+        sleep {grace} & s=$!; wait $s
+        kill -KILL $pids 2>/dev/null
+    ) </dev/null >/dev/null 2>&1 &
+    local watchdog=$!
+    wait $pid
+    local rc=$?
+    kill $watchdog 2>/dev/null
+    wait $watchdog 2>/dev/null
+    [ $rc -eq 0 ] || echo "$3 $rc" >> "$_status"
+    return $rc
+}}
+"""
+
+
+def _read_batch_status(status_path: str):
+    """Parse a batch status file
+
+    Returns:
+        tuple: ({index: exit_code} of failed scripts, set of timed-out indexes)
     """
+    exit_codes = {}
+    timed_out = set()
+    with open(status_path) as f:
+        for line in f:
+            idx, _, value = line.partition(" ")
+            value = value.strip()
+            if value == "timeout":
+                timed_out.add(int(idx))
+            elif value:
+                exit_codes[int(idx)] = int(value)
+    return exit_codes, timed_out
+
+
+def _run_batched_file_scripts(scripts_to_execute: list, full_container_name: str,
+                              script_type: str) -> Optional[list]:
+    """Run several file scripts in one bash process, in order, stopping at the first failure
 
-    # Default script lookup paths (in order of preference)
-    default_script_paths = [
-        # 1. Stack-specific scripts: stacks/{container_name}/init.sh or halt.sh
-        SCRIPTS_DIR / "stacks" / container_name / f"{script_type}.sh",
-        # 2. Simple init/halt scripts: init/{container_name}.sh or halt/{container_name}.sh
-        SCRIPTS_DIR / script_type / f"{container_name}.sh",
-    ]
-
-    # Find the first existing default script
-    default_script_path = None
-    default_script_name = None
-
-    for script_path in default_script_paths:
-        if script_path.exists():
-            default_script_path = script_path
-            default_script_name = str(script_path.relative_to(SCRIPTS_DIR))
-            logger.info("Found default %s script: %s", script_type, default_script_name)
-            break
+    Only used when retries are disabled: with a single process there is no
+    per-script retry, so each script would otherwise cost its own fork+exec
+    for no benefit. Each script keeps its own timeout.
+
+    Returns:
+        list or None: Result entries, None if the scripts can't be batched
+    """
+    for entry in scripts_to_execute:
+        entry['prepared'] = _prepare_script_entry(entry, full_container_name)
+    prepared = [entry['prepared'] for entry in scripts_to_execute]
+    if any(p is None or p[0] != 'file' for p in prepared):
+        return None  # run one by one, reusing entry['prepared']
+    
+    timeout = ScriptConfig.get_timeout(script_type)
+    grace = ScriptConfig.SIGTERM_GRACE
+    status_fd, status_path = tempfile.mkstemp(prefix="playground-batch-", suffix=".status")
+    os.close(status_fd)
+    # $BASH is the running shell; each script gets the container name as $1
+    batch_body = (
+        f"_status={shlex.quote(status_path)}\n"
+        + _BATCH_RUNNER.format(timeout=timeout, grace=grace)
+        + "\n".join(f'_run {shlex.quote(p[1])} "$1" {idx} || exit $?'
+                     for idx, p in enumerate(prepared))
+    )
+    labels = ", ".join(entry['label'] for entry in scripts_to_execute)
+    
+    logger.info("Executing %s file %s scripts in one batch", labels, script_type)
+    try:
+        result = _execute_script_internal(
+            f"{full_container_name}-{script_type}-batch.sh",
+            full_container_name,
+            script_type,
+            script_content=batch_body,
+            timeout=len(prepared) * (timeout + grace)
+        )
+        exit_codes, timed_out = _read_batch_status(status_path)
+    finally:
+        os.unlink(status_path)
+    
+    if result['status'] != 'success':
+        if not exit_codes:
+            logger.error("✗ %s file script batch FAILED (%s)", labels, result['status'])
+            raise Exception(f"{labels} file script batch failed: {result['stderr']}")
+        idx = min(exit_codes)
+        script_label = scripts_to_execute[idx]['label']
+        if idx in timed_out:
+            logger.error("✗ %s file script TIMEOUT in batch (exceeded %ds)", script_label, timeout)
+            raise Exception(f"{script_label} file script failed: "
+                            f"Script execution timeout after {timeout} seconds")
+        logger.error("✗ %s file script FAILED in batch (exit code: %d)", script_label, exit_codes[idx])
+        raise Exception(f"{script_label} file script failed: {result['stderr']}")
+    
+    # Every script ran and succeeded; they share the batch's output
+    result_entries = []
+    for entry in scripts_to_execute:
+        result_entry = _new_result_entry(entry)
+        result_entry['attempts'] = 1
+        result_entry['results'].append(result)
+        result_entries.append(result_entry)
+    
+    logger.info("✓ %s file script batch SUCCEEDED", labels)
+    return result_entries
+
+
+# ============================================================
+# HELPER: Collect scripts and log execution banners
+# ============================================================
+
+def _collect_scripts(script_config, full_container_name: str, container_name: str,
+                     script_type: str) -> list:
+    """Build the ordered list of scripts to run and log the start banner
+
+    Returns:
+        list: Script entries (default first, then custom); empty if none
+    """
+    # Find the default script (stacks/{name}/{type}.sh, then {type}/{name}.sh)
+    default_script = _get_script_index().get((container_name, script_type))
 
     # List to hold scripts to execute in order
     scripts_to_execute = []
 
     # 1. Add default script if it exists
-    if default_script_path:
+    if default_script:
+        default_script_path, default_script_name = default_script
+        logger.info("Found default %s script: %s", script_type, default_script_name)
         scripts_to_execute.append({
             'config': default_script_name,
             'label': 'default',
             'path': default_script_path
         })
 
-    
     # 2. Add custom script if provided
     if script_config:
         scripts_to_execute.append({
@@ -284,150 +1081,103 @@ def execute_script(
             'path': None
         })
     
-    # If no scripts to execute, return early
-    if not scripts_to_execute:
-        logger.debug("No scripts found (default or config) for %s (type: %s)",
-                    full_container_name, script_type)
+    if not scripts_to_execute or not logger.isEnabledFor(logging.INFO):
+        return scripts_to_execute
+    
+    script_list = "\n".join(
+        f"    {idx}. {script['label']} ({script['config'] if isinstance(script['config'], str) else 'inline'})"
+        for idx, script in enumerate(scripts_to_execute, 1)
+    )
+    logger.info("%s\nSCRIPT EXECUTION START\n  Container: %s\n  Type: %s (%s)\n  Scripts to execute: %d\n%s\n%s",
+               "=" * 80, full_container_name, script_type,
+               "post_start" if script_type == "init" else "pre_stop",
+               len(scripts_to_execute), script_list, "=" * 80)
+    return scripts_to_execute
+
+
+def _log_completed(full_container_name: str, script_type: str, script_results: list) -> None:
+    logger.info("%s\nSCRIPT EXECUTION COMPLETED - All scripts succeeded\n  Container: %s\n  Type: %s\n  Total scripts executed: %d\n%s",
+               "=" * 80, full_container_name, script_type, len(script_results), "=" * 80)
+
+
+def _log_failed(full_container_name: str, script_type: str, error: Exception) -> None:
+    logger.error("%s\nSCRIPT EXECUTION FAILED\nContainer: %s, Type: %s\nError: %s\n%s",
+                "=" * 80, full_container_name, script_type, str(error), "=" * 80)
+
+
+# ============================================================
+# MAIN: execute_script with retry logic
+# ============================================================
+
+# execute_script is synchronous on purpose: every caller (container
+# start/stop, restart, cleanup) already runs in an executor thread, so
+# scripts never block the event loop.
+
+def execute_script(
+    script_config,
+    full_container_name: str,
+    container_name: str,
+    script_type: str = "init"
+) -> None:
+    """Execute post-start or pre-stop script with retry logic
+
+    Executes scripts in the following order:
+    1. Default script if exists (using standardized structure)
+    2. Custom script from YAML config if provided
+
+    Both scripts are executed if they exist. Failed scripts trigger retries if enabled.
+
+    Args:
+        script_config: Script configuration (dict, str, or None)
+        full_container_name: Full container name (e.g., 'playground-mysql-8.0')
+        container_name: Container name without prefix (e.g., 'mysql-8.0')
+        script_type: Type of script - 'init' (post-start) or 'halt' (pre-stop)
+
+    Raises:
+        Exception: If script execution fails after all retries
+    """
+    # Fast path: most containers have neither a default nor a custom script
+    if not script_config and (container_name, script_type) not in _get_script_index():
         return
     
-    logger.info("=" * 80)
-    logger.info("SCRIPT EXECUTION START")
-    logger.info("  Container: %s", full_container_name)
-    logger.info("  Type: %s (%s)", script_type, "post_start" if script_type == "init" else "pre_stop")
-    logger.info("  Scripts to execute: %d", len(scripts_to_execute))
-    for idx, script in enumerate(scripts_to_execute, 1):
-        logger.info("    %d. %s (%s)", idx, script['label'], script['config'] if isinstance(script['config'], str) else 'inline')
-    logger.info("=" * 80)
+    scripts_to_execute = _collect_scripts(script_config, full_container_name,
+                                          container_name, script_type)
+    if not scripts_to_execute:
+        return
     
-    # Execute all scripts in order
+    # Execute all scripts (in order, or concurrently when enabled)
     script_results = []
     
     try:
-        for script_entry in scripts_to_execute:
-            script_to_execute = script_entry['config']
-            script_label = script_entry['label']
-            
-            result_entry = {
-                'label': script_label,
-                'config': script_to_execute,
-                'attempts': 0,
-                'results': []
-            }
-            
-            try:
-                # ====================================================
-                # INLINE SCRIPT EXECUTION
-                # ====================================================
-                if isinstance(script_to_execute, dict) and 'inline' in script_to_execute:
-                    script_content = script_to_execute['inline']
-                    
-                    # Retry loop for inline scripts
-                    for attempt in range(1, ScriptConfig.MAX_SCRIPT_RETRIES + 2):
-                        result_entry['attempts'] = attempt
-                        
-                        # Create temporary script file
-                        temp_script = f"/tmp/playground-script-{full_container_name}-{script_label}-{attempt}.sh"
-                        try:
-                            with open(temp_script, 'w') as f:
-                                f.write("#!/bin/bash\n")
-                                f.write(f'CONTAINER_NAME="{full_container_name}"\n')
-                                f.write(f'SHARED_DIR="{SHARED_DIR}"\n')
-                                f.write(script_content)
-                            
-                            os.chmod(temp_script, 0o755)
-                            
-                            logger.info("Executing %s inline %s script (attempt %d)",
-                                       script_label, script_type, attempt)
-                            
-                            result = _execute_script_internal(
-                                temp_script,
-                                full_container_name,
-                                script_type,
-                                attempt
-                            )
-                            
-                            result_entry['results'].append(result)
-                            
-                            # Check result
-                            if result['status'] == 'success':
-                                logger.info("✓ %s inline script SUCCEEDED", script_label)
-                                break
-                            else:
-                                if attempt < ScriptConfig.MAX_SCRIPT_RETRIES + 1 and ScriptConfig.ENABLE_SCRIPT_RETRY:
-                                    logger.warning("Retrying %s script after %.1fs delay (attempt %d/%d)",
-                                                 script_label, ScriptConfig.RETRY_DELAY_SECONDS,
-                                                 attempt, ScriptConfig.MAX_SCRIPT_RETRIES + 1)
-                                    time.sleep(ScriptConfig.RETRY_DELAY_SECONDS)
-                                else:
-                                    logger.error("✗ %s inline script FAILED after %d attempt(s)",
-                                               script_label, attempt)
-                                    raise Exception(f"{script_label} inline script failed: {result['stderr']}")
-                        
-                        finally:
-                            try:
-                                os.remove(temp_script)
-                            except:
-                                pass
-                
-                # ====================================================
-                # FILE-BASED SCRIPT EXECUTION
-                # ====================================================
-                elif isinstance(script_to_execute, str):
-                    script_path = SCRIPTS_DIR / script_to_execute
-                    
-                    if not script_path.exists():
-                        logger.warning("Script file not found: %s", script_path)
-                        continue
-                    
-                    # Retry loop for file scripts
-                    for attempt in range(1, ScriptConfig.MAX_SCRIPT_RETRIES + 2):
-                        result_entry['attempts'] = attempt
-                        
-                        logger.info("Executing %s file %s script: %s (attempt %d)",
-                                   script_label, script_type, script_to_execute, attempt)
-                        
-                        result = _execute_script_internal(
-                            str(script_path),
-                            full_container_name,
-                            script_type,
-                            attempt
-                        )
-                        
-                        result_entry['results'].append(result)
-                        
-                        # Check result
-                        if result['status'] == 'success':
-                            logger.info("✓ %s file script SUCCEEDED", script_label)
-                            break
-                        else:
-                            if attempt < ScriptConfig.MAX_SCRIPT_RETRIES + 1 and ScriptConfig.ENABLE_SCRIPT_RETRY:
-                                logger.warning("Retrying %s script after %.1fs delay (attempt %d/%d)",
-                                             script_label, ScriptConfig.RETRY_DELAY_SECONDS,
-                                             attempt, ScriptConfig.MAX_SCRIPT_RETRIES + 1)
-                                time.sleep(ScriptConfig.RETRY_DELAY_SECONDS)
-                            else:
-                                logger.error("✗ %s file script FAILED after %d attempt(s)",
-                                           script_label, attempt)
-                                raise Exception(f"{script_label} file script failed: {result['stderr']}")
-            
-            except Exception as e:
-                script_results.append(result_entry)
-                logger.error("✗ %s script execution error: %s", script_label, str(e))
-                raise
-            
-            script_results.append(result_entry)
+        batched = None
+        if not ScriptConfig.ENABLE_SCRIPT_RETRY and len(scripts_to_execute) > 1:
+            batched = _run_batched_file_scripts(scripts_to_execute, full_container_name, script_type)
+        
+        if batched is not None:
+            script_results.extend(batched)
+        elif ScriptConfig.PARALLEL_SCRIPTS and len(scripts_to_execute) > 1:
+            with ThreadPoolExecutor(max_workers=len(scripts_to_execute)) as executor:
+                futures = [
+                    executor.submit(_run_script_entry, script_entry,
+                                    full_container_name, script_type)
+                    for script_entry in scripts_to_execute
+                ]
+                errors = []
+                for future in as_completed(futures):
+                    try:
+                        script_results.append(future.result())
+                    except Exception as e:
+                        errors.append(e)
+                if errors:
+                    raise errors[0]
+        else:
+            for script_entry in scripts_to_execute:
+                script_results.append(
+                    _run_script_entry(script_entry, full_container_name, script_type)
+                )
         
-        logger.info("=" * 80)
-        logger.info("SCRIPT EXECUTION COMPLETED - All scripts succeeded")
-        logger.info("  Container: %s", full_container_name)
-        logger.info("  Type: %s", script_type)
-        logger.info("  Total scripts executed: %d", len(script_results))
-        logger.info("=" * 80)
+        _log_completed(full_container_name, script_type, script_results)
     
     except Exception as e:
-        logger.error("=" * 80)
-        logger.error("SCRIPT EXECUTION FAILED")
-        logger.error("Container: %s, Type: %s", full_container_name, script_type)
-        logger.error("Error: %s", str(e))
-        logger.error("=" * 80)
-        raise
\ No newline at end of file
+        _log_failed(full_container_name, script_type, e)
+        raise
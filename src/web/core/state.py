@@ -1,134 +1,207 @@
-from typing import Dict, Any
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
+import threading
+import time
 from src.web.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Marks type-specific fields an operation doesn't have (omitted from the API)
+_UNSET: Any = object()
+
+
+@dataclass(slots=True)
+class Operation:
+    """Background operation record
+
+    Slots keep long-lived completed operations small. Type-specific fields
+    stay _UNSET unless the operation type (or an update) sets them, so
+    to_dict() returns the same keys the old per-operation dicts had.
+    """
+    operation_id: str
+    operation: str
+    status: str = "running"
+    started_at: str = ""
+    completed_at: Optional[str] = None
+    total: int = 0
+    errors: List[str] = field(default_factory=list)
+    scripts_running: Dict[str, dict] = field(default_factory=dict)  # keyed by container
+    scripts_completed: List[dict] = field(default_factory=list)
+    operation_phase: Optional[str] = None  # Track Docker operation phases
+    container_name: str = ""  # Container for phase tracking
+
+    # Type-specific / result fields
+    group_name: Any = _UNSET
+    container: Any = _UNSET
+    containers: Any = _UNSET
+    started: Any = _UNSET
+    already_running: Any = _UNSET
+    stopped: Any = _UNSET
+    not_running: Any = _UNSET
+    restarted: Any = _UNSET
+    removed: Any = _UNSET
+    failed: Any = _UNSET
+    images_removed: Any = _UNSET
+    volumes_removed: Any = _UNSET
+    volumes_protected: Any = _UNSET
+    backup_path: Any = _UNSET
+    summary: Any = _UNSET
+    error: Any = _UNSET
+    debug_info: Any = _UNSET
+
+    # Any other key passed to update_operation
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    # Private, not serialized
+    _lock: Any = field(default_factory=threading.RLock, repr=False)
+    _completed_ts: Optional[float] = None
+
+    def update(self, updates: Dict[str, Any]) -> None:
+        private = [key for key in updates if key.startswith("_")]
+        if private:
+            raise ValueError(f"Cannot update private operation fields: {', '.join(private)}")
+        for key, value in updates.items():
+            if key in _OPERATION_FIELDS:
+                setattr(self, key, value)
+            else:
+                self.extra[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API shape of the operation (see models.types.OperationStatus)"""
+        with self._lock:
+            data = {}
+            for name in _SERIALIZED_FIELDS:
+                value = getattr(self, name)
+                if value is not _UNSET:
+                    data[name] = value
+            data["scripts_running"] = list(self.scripts_running.values())
+            data["scripts_completed"] = list(self.scripts_completed)
+            data.update(self.extra)
+        return data
+
+
+_OPERATION_FIELDS = frozenset(f.name for f in fields(Operation)) - {"extra"}
+_SERIALIZED_FIELDS = tuple(
+    f.name for f in fields(Operation) if f.name != "extra" and not f.name.startswith("_")
+)
+
 # Global state for background operations
-active_operations: Dict[str, dict] = {}
+active_operations: Dict[str, Operation] = {}
+
+def _now_iso() -> str:
+    """Current local time as ISO string"""
+    return datetime.now().isoformat()
+
+
+# Protects inserts/deletes on active_operations; each operation also carries
+# its own _lock (RLock) for updates to its fields
+_OPS_LOCK = threading.Lock()
+
+# (completed epoch, operation_id) in completion order, so cleanup only
+# looks at the operations that have expired
+_completed_queue: deque = deque()
+
+
+# Type-specific fields added by create_operation (defaults)
+_OP_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "start_group": {"group_name": "", "containers": [], "started": 0, "already_running": 0, "failed": 0},
+    "stop_group": {"group_name": "", "containers": [], "stopped": 0, "not_running": 0, "failed": 0},
+    "start": {"container": "", "started": 0, "already_running": 0, "failed": 0},
+    "stop": {"container": "", "stopped": 0, "not_running": 0, "failed": 0},
+    "stop_all": {"stopped": 0, "containers": []},
+    "restart_all": {"restarted": 0, "containers": []},
+    "cleanup": {"removed": 0, "failed": 0, "containers": []},
+}
+
+# Template fields whose value is taken from create_operation kwargs
+_OP_KWARG_FIELDS = frozenset({"group_name", "container"})
 
 
-def create_operation(operation_id: str, operation_type: str, **kwargs) -> dict:
+def create_operation(operation_id: str, operation_type: str, **kwargs) -> Operation:
     """Create a new operation entry"""
-    operation = {
-        "operation_id": operation_id,
-        "status": "running",
-        "operation": operation_type,
-        "started_at": datetime.now().isoformat(),
-        "completed_at": None,
-        "total": kwargs.get("total", 0),
-        "errors": [],
-        "scripts_running": [],  # Track script execution
-        "scripts_completed": [],  # Track completed scripts
-        "operation_phase": None,  # NEW: Track Docker operation phases
-        "container_name": kwargs.get("container", ""),  # Container for phase tracking
-    }
+    operation = Operation(
+        operation_id=operation_id,
+        operation=operation_type,
+        started_at=_now_iso(),
+        total=kwargs.get("total", 0),
+        container_name=kwargs.get("container", ""),
+    )
     
     # Add type-specific fields
-    if operation_type == "start_group":
-        operation.update({
-            "group_name": kwargs.get("group_name", ""),
-            "containers": [],
-            "started": 0,
-            "already_running": 0,
-            "failed": 0,
-        })
-    
-    elif operation_type == "stop_group":
-        operation.update({
-            "group_name": kwargs.get("group_name", ""),
-            "containers": [],
-            "stopped": 0,
-            "not_running": 0,
-            "failed": 0,
-        })
-    
-    elif operation_type == "start":
-        operation.update({
-            "container": kwargs.get("container", ""),
-            "started": 0,
-            "already_running": 0,
-            "failed": 0,
-        })
-
-    elif operation_type == "stop":
-        operation.update({
-            "container": kwargs.get("container", ""),
-            "stopped": 0,
-            "not_running": 0,
-            "failed": 0,
-        })
-    
-    elif operation_type == "stop_all":
-        operation.update({
-            "stopped": 0,
-            "containers": [],
-        })
-    
-    elif operation_type == "restart_all":
-        operation.update({
-            "restarted": 0,
-            "containers": [],
-        })
+    template = _OP_TEMPLATES.get(operation_type)
+    if template:
+        for key, default in template.items():
+            if key in _OP_KWARG_FIELDS:
+                setattr(operation, key, kwargs.get(key, default))
+            elif isinstance(default, list):
+                setattr(operation, key, [])  # fresh list per operation
+            else:
+                setattr(operation, key, default)
     
-    elif operation_type == "cleanup":
-        operation.update({
-            "removed": 0,
-            "failed": 0,
-            "containers": [],
-        })
-    
-    active_operations[operation_id] = operation
+    with _OPS_LOCK:
+        active_operations[operation_id] = operation
     logger.debug("Created operation %s: %s", operation_id, operation_type)
     
     return operation
 
 
-def get_operation(operation_id: str) -> Dict[str, Any] | None:
+def get_operation(operation_id: str) -> Optional[Operation]:
     """Get operation by ID"""
     return active_operations.get(operation_id)
 
 
+def serialize_operation(operation: Operation) -> Dict[str, Any]:
+    """Convert an operation to its API shape (scripts_running as a list, no private fields)"""
+    return operation.to_dict()
+
+
 def update_operation(operation_id: str, **updates) -> bool:
     """Update operation fields"""
-    if operation_id not in active_operations:
+    operation = active_operations.get(operation_id)
+    if operation is None:
         logger.warning("Operation %s not found", operation_id)
         return False
     
-    active_operations[operation_id].update(updates)
+    with operation._lock:
+        operation.update(updates)
     return True
 
 
 def add_script_tracking(operation_id: str, container: str, script_type: str) -> bool:
     """Track script execution start"""
-    if operation_id not in active_operations:
+    operation = active_operations.get(operation_id)
+    if operation is None:
         logger.warning("Operation %s not found when tracking script", operation_id)
         return False
     
     script_info = {
         "container": container,
         "type": script_type,
-        "started_at": datetime.now().isoformat()
+        "started_at": _now_iso()
     }
-    active_operations[operation_id]["scripts_running"].append(script_info)
+    with operation._lock:
+        operation.scripts_running[container] = script_info
     logger.debug("Added script tracking for %s: %s", container, script_type)
     return True
 
 
 def complete_script_tracking(operation_id: str, container: str) -> bool:
     """Mark script execution as complete"""
-    if operation_id not in active_operations:
+    operation = active_operations.get(operation_id)
+    if operation is None:
         logger.warning("Operation %s not found when completing script", operation_id)
         return False
     
-    running_scripts = active_operations[operation_id]["scripts_running"]
-    completed_script = next((s for s in running_scripts if s["container"] == container), None)
+    with operation._lock:
+        completed_script = operation.scripts_running.pop(container, None)
+        if completed_script:
+            completed_script["completed_at"] = _now_iso()
+            operation.scripts_completed.append(completed_script)
     
     if completed_script:
-        running_scripts.remove(completed_script)
-        completed_script["completed_at"] = datetime.now().isoformat()
-        active_operations[operation_id]["scripts_completed"].append(completed_script)
         logger.debug("Completed script tracking for %s", container)
         return True
     
@@ -142,9 +215,9 @@ def complete_operation(operation_id: str, **final_updates) -> bool:
         return False
     
     final_updates["status"] = "completed"
-    final_updates["completed_at"] = datetime.now().isoformat()
+    final_updates["completed_at"] = _now_iso()
     
-    return update_operation(operation_id, **final_updates)
+    return _finish_operation(operation_id, final_updates)
 
 
 def fail_operation(operation_id: str, error: str, debug_info: Dict[str, Any] = None, **extra_updates) -> bool:
@@ -155,7 +228,7 @@ def fail_operation(operation_id: str, error: str, debug_info: Dict[str, Any] = N
     updates = {
         "status": "error",
         "error": error,
-        "completed_at": datetime.now().isoformat(),
+        "completed_at": _now_iso(),
     }
 
     # Include detailed debug information if provided
@@ -164,26 +237,41 @@ def fail_operation(operation_id: str, error: str, debug_info: Dict[str, Any] = N
 
     updates.update(extra_updates)
 
-    return update_operation(operation_id, **updates)
+    return _finish_operation(operation_id, updates)
+
+
+def _finish_operation(operation_id: str, updates: Dict[str, Any]) -> bool:
+    """Apply final updates and queue the operation for cleanup on its first finish"""
+    operation = active_operations.get(operation_id)
+    if operation is None:
+        logger.warning("Operation %s not found", operation_id)
+        return False
+    
+    completed_ts = time.time()
+    with operation._lock:
+        operation.update(updates)
+        first_finish = operation._completed_ts is None
+        if first_finish:
+            operation._completed_ts = completed_ts
+    
+    if first_finish:
+        with _OPS_LOCK:
+            _completed_queue.append((completed_ts, operation_id))
+    return True
 
 
 def cleanup_old_operations(max_age_seconds: int = 3600) -> int:
-    """Remove completed operations older than max_age_seconds"""
-    now = datetime.now()
-    operations_to_remove = []
+    """Remove completed or failed operations older than max_age_seconds"""
+    cutoff = time.time() - max_age_seconds
+    removed = []
     
-    for op_id, op_data in active_operations.items():
-        if op_data.get("status") == "completed" and op_data.get("completed_at"):
-            try:
-                completed_at = datetime.fromisoformat(op_data["completed_at"])
-                age = (now - completed_at).total_seconds()
-                if age > max_age_seconds:
-                    operations_to_remove.append(op_id)
-            except ValueError:
-                pass
+    with _OPS_LOCK:
+        while _completed_queue and _completed_queue[0][0] < cutoff:
+            _, op_id = _completed_queue.popleft()
+            if active_operations.pop(op_id, None) is not None:
+                removed.append(op_id)
     
-    for op_id in operations_to_remove:
-        del active_operations[op_id]
+    for op_id in removed:
         logger.debug("Cleaned up old operation: %s", op_id)
     
-    return len(operations_to_remove)
\ No newline at end of file
+    return len(removed)
@@ -4,23 +4,101 @@ Asset versioning for cache busting.
 Generates versioned URLs for static assets based on file content hash.
 """
 import hashlib
+import mmap
 import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
+try:
+    import xxhash
+except ImportError:  # optional: fall back to hashlib.md5
+    xxhash = None
+
+# Assets at least this big are hashed through mmap instead of read()
+MMAP_MIN_SIZE = 64 * 1024
+
+# Threads used to hash all assets at startup
+WARMUP_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _new_hasher():
+    """Return a content hasher: xxh3_64 if xxhash is installed, else md5"""
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.md5()
+
+
+def _hash_file(full_path) -> str:
+    """Return the 8-character content hash of a file
+
+    Small files are read directly; larger ones are memory-mapped and
+    hashed in place, so no copy of the content is made in Python.
+    """
+    hash_obj = _new_hasher()
+    with open(full_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_MIN_SIZE:
+            hash_obj.update(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hash_obj.update(mapped)
+    return hash_obj.hexdigest()[:8]
+
+
 class AssetVersionManager:
     """Manages versioning for static assets using content hashing."""
 
     def __init__(self, static_dir: str):
         """
-        Initialize asset version manager.
+        Initialize asset version manager and hash all assets up front.
 
         Args:
             static_dir: Path to static files directory
         """
         self.static_dir = Path(static_dir)
         self._cache: Dict[str, str] = {}
+        self._url_cache: Dict[str, str] = {}
         self._enabled = True
+        self.warmup()
+
+    def _hash_asset(self, asset_path: str) -> Optional[str]:
+        """Hash one asset, returning its version or None if unreadable"""
+        try:
+            return _hash_file(self.static_dir / asset_path)
+        except OSError:
+            return None
+
+    def warmup(self) -> int:
+        """
+        Hash every file under static_dir so no request pays for first-time hashing.
+
+        Returns:
+            Number of assets cached
+        """
+        asset_paths = []
+        for root, _dirs, files in os.walk(self.static_dir):
+            rel_root = os.path.relpath(root, self.static_dir)
+            for name in files:
+                rel_path = name if rel_root == '.' else os.path.join(rel_root, name)
+                asset_paths.append(rel_path.replace(os.sep, '/'))
+
+        if not asset_paths:
+            return 0
+
+        max_workers = min(WARMUP_MAX_WORKERS, len(asset_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for asset_path, version in zip(asset_paths, executor.map(self._hash_asset, asset_paths)):
+                if version:
+                    self._cache[asset_path] = version
+                    self._url_cache[asset_path] = f"/static/{asset_path}?v={version}"
+
+        return len(self._cache)
+
+    @property
+    def asset_count(self) -> int:
+        """Number of assets with a cached version hash"""
+        return len(self._cache)
 
     def get_version(self, asset_path: str) -> str:
         """
@@ -36,23 +114,13 @@ class AssetVersionManager:
         if asset_path in self._cache:
             return self._cache[asset_path]
 
-        # Calculate hash
-        full_path = self.static_dir / asset_path
-
-        if not full_path.exists():
+        version = self._hash_asset(asset_path)
+        if not version:
             return ""
 
-        try:
-            with open(full_path, 'rb') as f:
-                content = f.read()
-                hash_obj = hashlib.md5(content)
-                version = hash_obj.hexdigest()[:8]
-
-                # Cache the result
-                self._cache[asset_path] = version
-                return version
-        except Exception:
-            return ""
+        # Cache the result
+        self._cache[asset_path] = version
+        return version
 
     def get_versioned_url(self, asset_path: str) -> str:
         """
@@ -67,16 +135,25 @@ class AssetVersionManager:
         if not self._enabled:
             return f"/static/{asset_path}"
 
+        url = self._url_cache.get(asset_path)
+        if url is None:
+            url = self._build_url(asset_path)
+        return url
+
+    def _build_url(self, asset_path: str) -> str:
+        """Build and cache the versioned URL of an asset missed by warmup"""
         version = self.get_version(asset_path)
+        if not version:
+            return f"/static/{asset_path}"  # not cached: the file may appear later
 
-        if version:
-            return f"/static/{asset_path}?v={version}"
-        else:
-            return f"/static/{asset_path}"
+        url = f"/static/{asset_path}?v={version}"
+        self._url_cache[asset_path] = url
+        return url
 
     def clear_cache(self):
         """Clear the version cache. Useful in development."""
         self._cache.clear()
+        self._url_cache.clear()
 
     def disable(self):
         """Disable versioning (for development)."""
@@ -121,7 +198,7 @@ def asset_url(asset_path: str) -> str:
     Returns:
         Versioned URL
     """
-    if _asset_manager:
-        return _asset_manager.get_versioned_url(asset_path)
-    else:
+    manager = _asset_manager
+    if manager is None:
         return f"/static/{asset_path}"
+    return manager.get_versioned_url(asset_path)
@@ -10,6 +10,7 @@ Examples:
 """
 
 PREFIX = "playground-"
+PREFIX_LEN = len(PREFIX)
 
 
 def to_full_name(name: str) -> str:
@@ -30,7 +31,7 @@ def to_full_name(name: str) -> str:
     """
     if not name:
         return ""
-    return name if name.startswith(PREFIX) else f"{PREFIX}{name}"
+    return name if name[:PREFIX_LEN] == PREFIX else f"{PREFIX}{name}"
 
 
 def to_display_name(name: str) -> str:
@@ -72,7 +73,7 @@ def has_prefix(name: str) -> bool:
     """
     if not name:
         return False
-    return name.startswith(PREFIX)
+    return name[:PREFIX_LEN] == PREFIX
 
 
 def normalize(name: str) -> str:
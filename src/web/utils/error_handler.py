@@ -3,9 +3,12 @@ Enhanced error handling utilities for web API
 Provides detailed error responses with stack traces in debug mode
 """
 
+import re
+import reprlib
 import traceback
 import sys
-from typing import Dict, Any, Optional
+from itertools import islice
+from typing import Dict, Any, Optional, Tuple
 from fastapi import HTTPException
 from pathlib import Path
 
@@ -13,6 +16,46 @@ from pathlib import Path
 _DEBUG_MODE = False
 
 
+# Bounded repr for captured local variables: big containers are cut
+# while being formatted instead of formatted in full and then truncated
+_LOCALS_REPR = reprlib.Repr()
+_LOCALS_REPR.maxstring = 200
+_LOCALS_REPR.maxother = 200
+_LOCALS_REPR.maxlist = 10
+_LOCALS_REPR.maxtuple = 10
+_LOCALS_REPR.maxset = 10
+_LOCALS_REPR.maxdict = 10
+
+
+# Common error patterns and tips (matched case-insensitively, in order)
+_TIP_RULES = [
+    (re.compile(r'not iterable.*int|int.*not iterable', re.I | re.S), [
+        "Check if YAML values need to be quoted (e.g., port mappings like '2222:22')",
+        "YAML may be parsing numbers as integers instead of strings",
+    ]),
+    (re.compile(r'port is already allocated', re.I), [
+        "Another container or process is using this port",
+        "Use 'docker ps' or 'netstat -tuln' to find what's using the port",
+    ]),
+    (re.compile(r'permission denied', re.I), [
+        "Check file/directory permissions",
+        "May need to run with appropriate user permissions",
+    ]),
+    (re.compile(r'connection refused|cannot connect', re.I), [
+        "Check if Docker daemon is running",
+        "Verify Docker socket permissions",
+    ]),
+    (re.compile(r'image not found', re.I), [
+        "Try pulling the image first with 'docker pull <image>'",
+        "Check if the image name and tag are correct",
+    ]),
+    (re.compile(r'file exists', re.I), [
+        "The file or directory already exists",
+        "Check if it's the correct path and type (file vs directory)",
+    ]),
+]
+
+
 def set_debug_mode(debug: bool):
     """Enable or disable debug mode globally"""
     global _DEBUG_MODE
@@ -24,13 +67,29 @@ def is_debug_mode() -> bool:
     return _DEBUG_MODE
 
 
-def format_exception_details(e: Exception, context: str = "") -> Dict[str, Any]:
+def _format_traceback(e: Exception) -> Tuple[traceback.TracebackException, str]:
+    """Walk the exception's traceback once and format it
+
+    Callers format an exception once per handler call and reuse the result
+    (stack trace and error location come from the same walk). Nothing is
+    cached across calls: a re-raised exception gains frames, and the
+    exception object may belong to third-party code.
+
+    Returns:
+        (TracebackException, formatted stack trace)
+    """
+    tb_exc = traceback.TracebackException.from_exception(e)
+    return tb_exc, "".join(tb_exc.format())
+
+
+def format_exception_details(e: Exception, context: str = "", include_locals: bool = True) -> Dict[str, Any]:
     """
     Format exception details with full stack trace and context
 
     Args:
         e: The exception to format
         context: Additional context about where the error occurred
+        include_locals: Also repr the failing frame's local variables (debug mode only)
 
     Returns:
         Dict containing error details
@@ -48,37 +107,38 @@ def format_exception_details(e: Exception, context: str = "") -> Dict[str, Any]:
     # Add detailed debug information if debug mode is enabled
     if _DEBUG_MODE:
         # Get the traceback
-        tb_lines = traceback.format_exception(type(e), e, e.__traceback__)
-        error_details["stack_trace"] = "".join(tb_lines)
-
-        # Get the frame where the error occurred
-        tb = e.__traceback__
-        while tb.tb_next:
-            tb = tb.tb_next
+        tb_exc, error_details["stack_trace"] = _format_traceback(e)
 
-        frame = tb.tb_frame
-        error_details["error_location"] = {
-            "file": frame.f_code.co_filename,
-            "line": tb.tb_lineno,
-            "function": frame.f_code.co_name
-        }
+        # Get the location where the error occurred (frames already summarized)
+        if tb_exc.stack:
+            location = tb_exc.stack[-1]
+            error_details["error_location"] = {
+                "file": location.filename,
+                "line": location.lineno,
+                "function": location.name
+            }
 
         # Add local variables (limited and sanitized)
-        try:
-            locals_dict = {}
-            for var_name, var_value in list(frame.f_locals.items())[:10]:  # Limit to 10
-                try:
-                    value_str = repr(var_value)
-                    if len(value_str) > 200:
-                        value_str = value_str[:200] + "..."
-                    locals_dict[var_name] = value_str
-                except:
-                    locals_dict[var_name] = "<unable to display>"
-
-            if locals_dict:
-                error_details["local_variables"] = locals_dict
-        except:
-            pass
+        if include_locals and e.__traceback__ is not None:
+            tb = e.__traceback__
+            while tb.tb_next:
+                tb = tb.tb_next
+
+            try:
+                locals_dict = {}
+                for var_name, var_value in islice(tb.tb_frame.f_locals.items(), 10):  # Limit to 10
+                    try:
+                        value_str = _LOCALS_REPR.repr(var_value)
+                        if len(value_str) > 200:
+                            value_str = value_str[:200] + "..."
+                        locals_dict[var_name] = value_str
+                    except:
+                        locals_dict[var_name] = "<unable to display>"
+
+                if locals_dict:
+                    error_details["local_variables"] = locals_dict
+            except:
+                pass
 
         # Add helpful debugging tips
         error_details["debug_tips"] = get_debug_tips(e)
@@ -88,34 +148,12 @@ def format_exception_details(e: Exception, context: str = "") -> Dict[str, Any]:
 
 def get_debug_tips(e: Exception) -> list:
     """Get helpful debugging tips based on the exception type"""
-    tips = []
-
-    error_msg = str(e).lower()
-
-    # Common error patterns and tips
-    if "not iterable" in error_msg and "int" in error_msg:
-        tips.append("Check if YAML values need to be quoted (e.g., port mappings like '2222:22')")
-        tips.append("YAML may be parsing numbers as integers instead of strings")
-
-    if "port is already allocated" in error_msg:
-        tips.append("Another container or process is using this port")
-        tips.append("Use 'docker ps' or 'netstat -tuln' to find what's using the port")
-
-    if "permission denied" in error_msg:
-        tips.append("Check file/directory permissions")
-        tips.append("May need to run with appropriate user permissions")
+    error_msg = str(e)
 
-    if "connection refused" in error_msg or "cannot connect" in error_msg:
-        tips.append("Check if Docker daemon is running")
-        tips.append("Verify Docker socket permissions")
-
-    if "image not found" in error_msg:
-        tips.append("Try pulling the image first with 'docker pull <image>'")
-        tips.append("Check if the image name and tag are correct")
-
-    if "file exists" in error_msg:
-        tips.append("The file or directory already exists")
-        tips.append("Check if it's the correct path and type (file vs directory)")
+    tips = []
+    for pattern, rule_tips in _TIP_RULES:
+        if pattern.search(error_msg):
+            tips.extend(rule_tips)
 
     return tips
 
@@ -138,40 +176,43 @@ def create_error_response(
     Returns:
         HTTPException with detailed error information
     """
-    error_details = format_exception_details(e, context)
-
-    # Log the error if logger provided
-    if logger:
-        if _DEBUG_MODE:
-            logger.error(
-                "%s: %s\n%s",
-                context if context else "Error",
-                str(e),
-                error_details.get("stack_trace", ""),
-                exc_info=True
-            )
-        else:
-            logger.error("%s: %s", context if context else "Error", str(e))
+    error_message = str(e)
 
     # Create response content
     response_content = {
-        "error": error_details["error"],
-        "error_type": error_details["error_type"]
+        "error": error_message,
+        "error_type": type(e).__name__
     }
 
     if context:
         response_content["context"] = context
 
-    # Include debug information if debug mode is enabled
-    if _DEBUG_MODE:
-        response_content["debug_info"] = {
-            "stack_trace": error_details.get("stack_trace"),
-            "error_location": error_details.get("error_location"),
-            "local_variables": error_details.get("local_variables"),
-            "debug_tips": error_details.get("debug_tips", [])
-        }
-        response_content["_debug_mode"] = True
-        response_content["_message"] = "Debug mode is enabled - detailed error information included"
+    # Fast path: without debug mode there is no traceback to format
+    if not _DEBUG_MODE:
+        if logger:
+            logger.error("%s: %s", context if context else "Error", error_message)
+        return HTTPException(status_code=status_code, detail=response_content)
+
+    error_details = format_exception_details(e, context)
+
+    # Log the error if logger provided
+    if logger:
+        logger.error(
+            "%s: %s\n%s",
+            context if context else "Error",
+            error_message,
+            error_details.get("stack_trace", "")  # already formatted: no exc_info
+        )
+
+    # Include debug information
+    response_content["debug_info"] = {
+        "stack_trace": error_details.get("stack_trace"),
+        "error_location": error_details.get("error_location"),
+        "local_variables": error_details.get("local_variables"),
+        "debug_tips": error_details.get("debug_tips", [])
+    }
+    response_content["_debug_mode"] = True
+    response_content["_message"] = "Debug mode is enabled - detailed error information included"
 
     return HTTPException(status_code=status_code, detail=response_content)
 
@@ -189,9 +230,9 @@ def log_exception(e: Exception, context: str = "", logger=None):
         import logging
         logger = logging.getLogger(__name__)
 
-    error_details = format_exception_details(e, context)
-
     if _DEBUG_MODE:
+        # Locals aren't logged, don't materialize them
+        error_details = format_exception_details(e, context, include_locals=False)
         logger.error(
             "%s: %s\nLocation: %s:%s in %s()\nStack trace:\n%s",
             context if context else "Exception",
@@ -2,6 +2,9 @@
 import re
 from typing import Any
 
+# Splits a string into text and digit runs, keeping the digits
+_NUM_SPLIT_RE = re.compile(r'([0-9]+)')
+
 
 def natural_sort_key(key: str) -> list[Any]:
     """Convert string for natural sorting (10 > 2)
@@ -10,6 +13,8 @@ def natural_sort_key(key: str) -> list[Any]:
         sorted(['img10', 'img2', 'img1'], key=natural_sort_key)
         # Returns ['img1', 'img2', 'img10']
     """
-    def convert(text):
-        return int(text) if text.isdigit() else text.lower()
-    return [convert(c) for c in re.split('([0-9]+)', key)]
\ No newline at end of file
+    # split() alternates text/digits (text first, possibly ''), so convert
+    # each half with one C-level map instead of testing every token
+    parts = _NUM_SPLIT_RE.split(key.lower())
+    parts[1::2] = map(int, parts[1::2])
+    return parts
\ No newline at end of file
@@ -1,24 +1,55 @@
 """MOTD (Message of the Day) processing utilities"""
 import re
+from html import escape as _html_escape
 from markupsafe import Markup
 
+# Box drawing characters removed by clean_motd_text (one translate() pass)
+_BOX_TRANS = str.maketrans('', '', '╔╚╗╝║═─┌┐└┘│├┤┼')
+
+# Lines containing any of these are separators (motd_to_html) or
+# decorations, not commands (parse_motd_commands)
+_SEPARATOR_CHARS = frozenset('═║╔╚╗╝')
+_BOX_CHARS = frozenset('║═╔╚╗╝─┌┐└┘')
+
+# Substrings marking a MOTD line as a command or a URL (parse_motd_commands)
+_COMMAND_HINT_RE = re.compile(
+    r'apk |apt |apt-get |npm |pip |docker |curl |wget |chmod |chown |mkdir |cd |\./'
+)
+_URL_SCHEME_RE = re.compile(r'(?:https?|ftp)://')
+
+# ANSI colors used by format_motd_for_terminal
+_ANSI_CYAN = '\x1b[36m'
+_ANSI_GREEN_BOLD = '\x1b[1;32m'
+_ANSI_YELLOW = '\x1b[33m'
+_ANSI_RESET = '\x1b[0m'
+
+# Line prefix -> ANSI color
+# ('⚠️' is two code points: the sign plus a variation selector)
+_TERMINAL_PREFIX_COLORS = {
+    '🔐': _ANSI_GREEN_BOLD, '📊': _ANSI_GREEN_BOLD, '📁': _ANSI_GREEN_BOLD,
+    '💡': _ANSI_YELLOW, '⚠️': _ANSI_YELLOW,
+}
+
+# Pattern per riconoscere URL (http, https, ftp)
+_URL_RE = re.compile(r'(?:https?|ftp)://[^\s<>"{}|\\^`\[\]]+')
+
+
+def _make_link(match) -> str:
+    """Sostituzione per _URL_RE: link HTML con il dominio come testo"""
+    url = match.group(0)
+    # Estrai il dominio per il testo del link
+    start = url.find('//') + 2
+    end = url.find('/', start)
+    domain = url[start:end] if end != -1 else url[start:]
+    return f'<a href="{url}" target="_blank" rel="noopener noreferrer" class="motd-link" title="{url}">{domain}</a>'
+
 
 def parse_urls(text: str) -> Markup:
     """Converte gli URL in link HTML"""
     if not text:
         return Markup("")
     
-    # Pattern per riconoscere URL (http, https, ftp)
-    url_pattern = r'(https?|ftp)://[^\s<>"{}|\\^`\[\]]+'
-    
-    def make_link(match):
-        url = match.group(0)
-        # Estrai il dominio per il testo del link
-        domain = url.split('//')[1].split('/')[0]
-        return f'<a href="{url}" target="_blank" rel="noopener noreferrer" class="motd-link" title="{url}">{domain}</a>'
-    
-    html = re.sub(url_pattern, make_link, text)
-    return Markup(html)
+    return Markup(_URL_RE.sub(_make_link, text))
 
 
 def motd_to_html(motd_text: str) -> Markup:
@@ -30,7 +61,8 @@ def motd_to_html(motd_text: str) -> Markup:
     lines = motd_text.split('\n')
     
     for line in lines:
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped:
             html.append('')
             continue
         
@@ -38,21 +70,19 @@ def motd_to_html(motd_text: str) -> Markup:
         html_line = escape_html(line)
         
         # Colora le righe di separazione
-        if any(c in line for c in ['═', '║', '╔', '╚', '╗', '╝']):
+        if not _SEPARATOR_CHARS.isdisjoint(line):
             html_line = f'<span class="motd-separator">{html_line}</span>'
         
         # Colora le emoji e testo speciale
-        elif line.strip().startswith(('🔐', '📊', '📁', '🚀')):
+        elif stripped.startswith(('🔐', '📊', '📁', '🚀')):
             html_line = f'<span class="motd-highlight">{html_line}</span>'
-        elif line.strip().startswith(('💡', '⚠️', '❌')):
+        elif stripped.startswith(('💡', '⚠️', '❌')):
             html_line = f'<span class="motd-warning">{html_line}</span>'
-        elif ' # ' in line:  # Commenti
+        else:  # Commenti (' # ' cercato una sola volta)
             html_line = highlight_command_with_comment(html_line)
         
-        # Applica il parsing degli URL
-        html_line = parse_urls(html_line)
-        
-        html.append(str(html_line))
+        # Applica il parsing degli URL (Markup una sola volta, alla fine)
+        html.append(_URL_RE.sub(_make_link, html_line))
     
     # Crea paragrafi
     result = '<br>\n'.join(html)
@@ -61,24 +91,13 @@ def motd_to_html(motd_text: str) -> Markup:
 
 def escape_html(text: str) -> str:
     """Escapa i caratteri HTML speciali"""
-    replacements = {
-        '&': '&amp;',
-        '<': '&lt;',
-        '>': '&gt;',
-        '"': '&quot;',
-        "'": '&#39;'
-    }
-    for char, escaped in replacements.items():
-        text = text.replace(char, escaped)
-    return text
+    return _html_escape(text, quote=True)
 
 
 def highlight_command_with_comment(line: str) -> str:
     """Evidenzia il comando e il commento separatamente"""
-    if ' # ' in line:
-        parts = line.split(' # ', 1)
-        command = parts[0]
-        comment = parts[1]
+    command, sep, comment = line.partition(' # ')
+    if sep:
         return f'<span class="motd-command">{command}</span> <span class="motd-comment"># {comment}</span>'
     return line
 
@@ -94,32 +113,24 @@ def parse_motd_commands(motd_text: str) -> list[dict]:
         # Extract lines that look like commands or URLs
         # Exclude: empty lines, box drawing chars, section headers
         if (line and
-            not any(c in line for c in ['║', '═', '╔', '╚', '╗', '╝', '─', '┌', '┐', '└', '┘']) and
-            not line.startswith('Note:') and
-            not line.startswith('⚠️') and
-            not line.startswith('💡') and
-            not line.startswith('Section:') and
+            _BOX_CHARS.isdisjoint(line) and
+            not line.startswith(('Note:', '⚠️', '💡', 'Section:')) and
             len(line) > 3):  # Almeno 3 caratteri
             
-            # Controlla se è un comando o una URL
-            is_command = any(cmd in line for cmd in ['apk ', 'apt ', 'apt-get ', 'npm ', 'pip ', 'docker ', 
-                                                      'curl ', 'wget ', 'chmod ', 'chown ', 'mkdir ', 'cd ',
-                                                      './']) or ' # ' in line
-            is_url = any(protocol in line for protocol in ['http://', 'https://', 'ftp://'])
+            # Separa comando/URL e descrizione (una sola scansione per ' # ')
+            command, sep, description = line.partition(' # ')
             
-            if is_command or is_url:
-                # Separa comando/URL e descrizione
-                if ' # ' in line:
-                    command, description = line.split(' # ', 1)
-                    commands.append({
-                        'command': command.strip(),
-                        'description': description.strip()
-                    })
-                else:
-                    commands.append({
-                        'command': line,
-                        'description': ''
-                    })
+            # Un commento ' # ' basta; altrimenti controlla se è un comando o una URL
+            if sep:
+                commands.append({
+                    'command': command.strip(),
+                    'description': description.strip()
+                })
+            elif _COMMAND_HINT_RE.search(line) or _URL_SCHEME_RE.search(line):
+                commands.append({
+                    'command': line,
+                    'description': ''
+                })
     
     return commands
 
@@ -129,34 +140,15 @@ def clean_motd_text(motd_text: str) -> str:
     if not motd_text:
         return ""
     
-    # Box drawing characters to remove
-    box_chars = ['╔', '╚', '╗', '╝', '║', '═', '─', '┌', '┐', '└', '┘', '│', '├', '┤', '┼']
-    cleaned = motd_text
-    for char in box_chars:
-        cleaned = cleaned.replace(char, '')
-    
-    # Remove lines that are only spaces or have only dashes
+    # Remove box drawing characters, then keep the non-blank lines
+    # (right-trimmed) in a single pass
     lines = []
-    for line in cleaned.split('\n'):
-        # Remove lines with only drawing characters
-        if line.strip() and not all(c in '─═ ' for c in line):
-            lines.append(line.rstrip())
-        elif line.strip():  # Keep non-empty lines
-            lines.append(line.rstrip())
-    
-    # Remove multiple consecutive empty lines
-    result = []
-    prev_empty = False
-    for line in lines:
-        if not line.strip():
-            if not prev_empty:
-                result.append('')
-            prev_empty = True
-        else:
-            result.append(line)
-            prev_empty = False
+    for line in motd_text.translate(_BOX_TRANS).split('\n'):
+        line = line.rstrip()
+        if line:
+            lines.append(line)
     
-    return '\n'.join(result).strip()
+    return '\n'.join(lines).strip()
 
 
 def format_motd_for_terminal(motd: str) -> str:
@@ -164,18 +156,17 @@ def format_motd_for_terminal(motd: str) -> str:
     if not motd:
         return ""
     
-    formatted = motd.replace('\n', '\r\n')
-    lines = formatted.split('\r\n')
     colored_lines = []
-    
-    for line in lines:
+    for line in motd.split('\n'):
         if '═' in line or '║' in line:
-            colored_lines.append(f'\x1b[36m{line}\x1b[0m')  # Cyan
-        elif line.strip().startswith(('🔐', '📊', '📁')):
-            colored_lines.append(f'\x1b[1;32m{line}\x1b[0m')  # Green bold
-        elif line.strip().startswith(('💡', '⚠️')):
-            colored_lines.append(f'\x1b[33m{line}\x1b[0m')  # Yellow
+            colored_lines.append(_ANSI_CYAN + line + _ANSI_RESET)
+            continue
+        
+        head = line.lstrip()
+        color = _TERMINAL_PREFIX_COLORS.get(head[:1]) or _TERMINAL_PREFIX_COLORS.get(head[:2])
+        if color:
+            colored_lines.append(color + line + _ANSI_RESET)
         else:
             colored_lines.append(line)
     
-    return '\r\n'.join(colored_lines) + '\r\n'
\ No newline at end of file
+    return '\r\n'.join(colored_lines) + '\r\n'